@@ -3,33 +3,83 @@
 Script to clean whitespace issues in Python files for CI compliance.
 """
 
+import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+_TRAILING_WHITESPACE = re.compile(r"[^\S\n]+(?=\n|\Z)")
+CACHE_FILE = '.clean_whitespace_cache.json'
+
 
 def clean_whitespace_in_file(filepath):
-    """Clean trailing whitespace and blank lines with whitespace."""
-    with open(filepath, 'r', encoding='utf-8') as f:
+    """Clean trailing whitespace and blank lines with whitespace.
+
+    Returns True if the file was rewritten.
+    """
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
         content = f.read()
-    
-    lines = content.splitlines()
-    cleaned_lines = [line.rstrip() for line in lines]
-    
-    cleaned_content = '\n'.join(cleaned_lines)
-    if content.endswith('\n'):
-        cleaned_content += '\n'
-    
-    with open(filepath, 'w', encoding='utf-8') as f:
+
+    cleaned_content = _TRAILING_WHITESPACE.sub('', content)
+    if cleaned_content == content:
+        return False
+
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
         f.write(cleaned_content)
-    
-    print(f'Cleaned whitespace in {filepath}')
+
+    return True
+
+
+def iter_python_files(path):
+    """Yield paths of all Python files below a directory."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+
+
+def _stat_key(filepath):
+    """Return the (mtime_ns, size) pair used to detect unchanged files."""
+    st = os.stat(filepath)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_cache():
+    """Load stat keys of files that were clean on the previous run."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    """Persist stat keys of clean files for the next run."""
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+
 
 def main():
     """Clean all Python files in the project."""
-    for root, dirs, files in os.walk('job_instruction_downloader'):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                clean_whitespace_in_file(filepath)
+    cache = load_cache()
+    files = list(iter_python_files('job_instruction_downloader'))
+    keys = {filepath: _stat_key(filepath) for filepath in files}
+    pending = [filepath for filepath in files if cache.get(filepath) != keys[filepath]]
+
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(clean_whitespace_in_file, pending, chunksize=16))
+
+    cleaned_files = [filepath for filepath, cleaned in zip(pending, results) if cleaned]
+    for filepath in cleaned_files:
+        keys[filepath] = _stat_key(filepath)
+        print(f'Cleaned whitespace in {filepath}')
+
+    save_cache(keys)
+    print(f'Checked {len(pending)} of {len(files)} files, cleaned {len(cleaned_files)}')
+
 
 if __name__ == '__main__':
     main()
@@ -22,6 +22,15 @@ class BaseResourceAdapter(ABC):
         self.config = config
         self.site_config = config.get("site_config", {})
 
+        rate_limits = self.site_config.get("rate_limiting", {})
+        self._rate_limits: Dict[str, Any] = rate_limits if isinstance(rate_limits, dict) else {}
+
+        download_config = self.site_config.get("download", {})
+        self._download_config: Dict[str, Any] = download_config if isinstance(download_config, dict) else {}
+
+        validation_config = self._download_config.get("validation", {})
+        self._validation_config: Dict[str, Any] = validation_config if isinstance(validation_config, dict) else {}
+
     @abstractmethod
     def authenticate(self, credentials: Optional[Dict[str, Any]] = None) -> bool:
         """Authenticate with the resource.
@@ -90,8 +99,7 @@ class BaseResourceAdapter(ABC):
         Returns:
             Rate limiting configuration dictionary.
         """
-        rate_limits = self.site_config.get("rate_limiting", {})
-        return rate_limits if isinstance(rate_limits, dict) else {}
+        return self._rate_limits
 
     def get_download_config(self) -> Dict[str, Any]:
         """Get download configuration.
@@ -99,8 +107,7 @@ class BaseResourceAdapter(ABC):
         Returns:
             Download configuration dictionary.
         """
-        download_config = self.site_config.get("download", {})
-        return download_config if isinstance(download_config, dict) else {}
+        return self._download_config
 
     def get_validation_config(self) -> Dict[str, Any]:
         """Get validation configuration.
@@ -108,5 +115,4 @@ class BaseResourceAdapter(ABC):
         Returns:
             Validation configuration dictionary.
         """
-        validation_config = self.get_download_config().get("validation", {})
-        return validation_config if isinstance(validation_config, dict) else {}
+        return self._validation_config
@@ -3,23 +3,144 @@ Consultant.ru resource adapter implementation.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Callable, Iterator
 from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
 
 from .base_resource_adapter import BaseResourceAdapter
 from ...models.job_instruction import JobInstruction
 from ...models.department import Department
+from ..parsers.base_parser import NeedsJavaScript, WAIT_POLL_FREQUENCY
 from ..parsers.consultant_parser import ConsultantParser
+from ...utils.file_watcher import PARTIAL_DOWNLOAD_SUFFIXES, wait_for_file_condition
+
+EXPORT_BUTTON_BY_TITLE = (By.CSS_SELECTOR, "a[title*='Word']")
+EXPORT_BUTTON_BY_TEXT = (By.PARTIAL_LINK_TEXT, "Экспорт в Word")
+
+
+class DriverPool:
+    """Bounded pool of reusable WebDriver instances."""
+
+    def __init__(self,
+                 size: int,
+                 driver_factory: Callable[[], webdriver.Chrome],
+                 health_check: Optional[Callable[[webdriver.Chrome], bool]] = None):
+        """Initialize the driver pool.
+
+        Args:
+            size: Maximum number of drivers kept alive at once.
+            driver_factory: Callable that starts a new WebDriver.
+            health_check: Callable that reports whether a pooled driver is still usable.
+        """
+        self.size = max(1, size)
+        self.driver_factory = driver_factory
+        self.health_check = health_check
+        self.logger = logging.getLogger(__name__)
+
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._lock = threading.Lock()
+
+    def _take(self) -> webdriver.Chrome:
+        """Take an idle driver, starting one if the pool has room."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._drivers) < self.size:
+                driver = self.driver_factory()
+                self._drivers.append(driver)
+                return driver
+
+        return self._idle.get()
+
+    def _replace(self, driver: webdriver.Chrome) -> webdriver.Chrome:
+        """Quit a broken driver and start a new one in its slot."""
+        self._quit(driver)
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            new_driver = self.driver_factory()
+            self._drivers.append(new_driver)
+        return new_driver
+
+    def _quit(self, driver: webdriver.Chrome) -> None:
+        """Quit a driver, logging any error."""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.error(f"Error closing WebDriver: {e}")
+
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        """Borrow a driver from the pool for the duration of the block.
+
+        Yields:
+            Ready to use WebDriver instance.
+        """
+        driver = self._take()
+
+        if self.health_check is not None and not self.health_check(driver):
+            self.logger.warning("WebDriver session lost, restarting browser")
+            driver = self._replace(driver)
+
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """Return a driver to the pool.
+
+        Args:
+            driver: Driver previously obtained from the pool.
+        """
+        if driver in self._drivers:
+            self._idle.put(driver)
+
+    def close_all(self) -> None:
+        """Quit every driver started by the pool."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+        for driver in drivers:
+            self._quit(driver)
 
 
 class ConsultantAdapter(BaseResourceAdapter):
     """Resource adapter for Consultant.ru website."""
 
+    CHROME_ARGUMENTS = (
+        "--headless",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--window-size=1920,1080",
+    )
+    PAGE_LOAD_STRATEGY = "eager"
+    CHROME_PREFS = {
+        "download.prompt_for_download": False,
+        "download.directory_upgrade": True,
+        "safebrowsing.enabled": True,
+        "profile.managed_default_content_settings.images": 2
+    }
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the Consultant adapter.
 
@@ -29,6 +150,115 @@ class ConsultantAdapter(BaseResourceAdapter):
         super().__init__(config)
         self.logger = logging.getLogger(__name__)
         self.parser = ConsultantParser(config)
+        self._chrome_options = self._make_options()
+        self._download_dirs: Dict[Optional[str], Path] = {}
+        self._connection_pool_size = config.get("selenium", {}).get("connection_pool_maxsize", 20)
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        self._http.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        self.pool = DriverPool(
+            self.get_download_config().get("parallelism", 4),
+            self._create_driver,
+            self._is_driver_alive
+        )
+
+    def _make_options(self, prefs: Optional[Dict[str, Any]] = None) -> ChromeOptions:
+        """Build Chrome options from the adapter's base arguments.
+
+        Args:
+            prefs: Chrome preferences to apply. If None, uses CHROME_PREFS.
+
+        Returns:
+            Chrome options instance.
+        """
+        chrome_options = ChromeOptions()
+        chrome_options.page_load_strategy = self.PAGE_LOAD_STRATEGY
+        for argument in self.CHROME_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_experimental_option("prefs", dict(self.CHROME_PREFS if prefs is None else prefs))
+        return chrome_options
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Start a new headless Chrome instance.
+
+        Returns:
+            New WebDriver instance.
+        """
+        driver = webdriver.Chrome(options=self._chrome_options, keep_alive=True)
+        self._configure_connection_pool(driver)
+        return driver
+
+    def _is_driver_alive(self, driver: webdriver.Chrome) -> bool:
+        """Check whether a pooled driver still has a usable session.
+
+        Args:
+            driver: Driver to check.
+
+        Returns:
+            True if the session responds, False otherwise.
+        """
+        if not driver.session_id:
+            return False
+
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            self._download_dirs.pop(driver.session_id, None)
+            return False
+
+    def _prepare_driver(self, driver: webdriver.Chrome, download_dir: Optional[Path] = None) -> None:
+        """Reset a borrowed driver before use.
+
+        The configured download directory is remembered per WebDriver session,
+        so a replacement browser is always configured again.
+
+        Args:
+            driver: Driver borrowed from the pool.
+            download_dir: Directory Chrome should save downloads to.
+        """
+        driver.delete_all_cookies()
+
+        if download_dir is not None and self._download_dirs.get(driver.session_id) != download_dir:
+            driver.execute_cdp_cmd(
+                "Page.setDownloadBehavior",
+                {"behavior": "allow", "downloadPath": str(download_dir)}
+            )
+            self._download_dirs[driver.session_id] = download_dir
+
+    def _configure_connection_pool(self, driver: webdriver.Chrome) -> None:
+        """Enlarge the keep-alive pool used for WebDriver commands.
+
+        Selenium creates its urllib3 pool with a single connection, so concurrent
+        commands open and drop sockets to chromedriver. The pool is rebuilt through
+        Selenium's own factory so proxy and certificate settings are preserved.
+
+        Args:
+            driver: Freshly started WebDriver instance.
+        """
+        executor: Any = driver.command_executor
+
+        try:
+            executor._client_config.init_args_for_pool_manager = {
+                "init_args_for_pool_manager": {"maxsize": self._connection_pool_size}
+            }
+            old_conn = getattr(executor, "_conn", None)
+            executor._conn = executor._get_connection_manager()
+            if old_conn is not None:
+                old_conn.clear()
+        except AttributeError as e:
+            self.logger.debug(f"WebDriver connection pool not configurable: {e}")
+
+    def close(self) -> None:
+        """Quit all pooled WebDrivers and close the HTTP session."""
+        self.pool.close_all()
+        self._download_dirs.clear()
+        self._http.close()
+
+    def __del__(self):
+        """Release the browsers when the adapter is garbage collected."""
+        if getattr(self, "pool", None) is not None:
+            self.close()
 
     def authenticate(self, credentials: Optional[Dict[str, Any]] = None) -> bool:
         """Authenticate with Consultant.ru.
@@ -52,24 +282,17 @@ class ConsultantAdapter(BaseResourceAdapter):
             List of available documents.
         """
         try:
-            from selenium.webdriver.chrome.options import Options as ChromeOptions
-            
-            chrome_options = ChromeOptions()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            
-            driver = webdriver.Chrome(options=chrome_options)
-            
             try:
-                documents = self.parser.extract_documents(driver, department)
-                self.logger.info(f"Extracted {len(documents)} documents for department {department.name}")
-                return documents
-            finally:
-                driver.quit()
-                
+                documents = self.parser.extract_documents_static(self._http, department)
+            except (NeedsJavaScript, requests.RequestException) as e:
+                self.logger.info(f"Falling back to browser for {department.name}: {e}")
+                with self.pool.acquire() as driver:
+                    self._prepare_driver(driver)
+                    documents = self.parser.extract_documents(driver, department)
+
+            self.logger.info(f"Extracted {len(documents)} documents for department {department.name}")
+            return documents
+
         except Exception as e:
             self.logger.error(f"Error getting document list: {e}")
             return []
@@ -85,50 +308,89 @@ class ConsultantAdapter(BaseResourceAdapter):
             True if download successful, False otherwise.
         """
         try:
-            from selenium.webdriver.chrome.options import Options as ChromeOptions
-            import requests
-            import time
-            
-            chrome_options = ChromeOptions()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            
-            prefs = {
-                "download.default_directory": str(download_path.parent),
-                "download.prompt_for_download": False,
-                "download.directory_upgrade": True,
-                "safebrowsing.enabled": True
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
-            
-            driver = webdriver.Chrome(options=chrome_options)
-            
-            try:
-                driver.get(document.url)
-                time.sleep(2)
-                
-                export_button = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Экспорт в Word') or contains(@title, 'Word')]"))
-                )
-                export_button.click()
-                
-                time.sleep(5)
-                
-                if download_path.exists() and download_path.stat().st_size > 0:
-                    self.logger.info(f"Successfully downloaded document: {document.title}")
-                    return True
-                else:
-                    self.logger.warning(f"Download may have failed for: {document.title}")
-                    return False
-                    
-            finally:
-                driver.quit()
-                
+            with self.pool.acquire() as driver:
+                return self._download_with(driver, document, download_path)
+
         except Exception as e:
             self.logger.error(f"Error downloading document {document.title}: {e}")
             return False
 
+    def download_documents(self, documents: List[JobInstruction], out_dir: Path) -> List[bool]:
+        """Download several documents in parallel using the driver pool.
+
+        Args:
+            documents: Documents to download.
+            out_dir: Directory to save the documents to.
+
+        Returns:
+            Download result for each document, in input order.
+        """
+        if not documents:
+            return []
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+            return list(executor.map(
+                lambda document: self.download_document(document, out_dir / document.filename),
+                documents
+            ))
+
+    def _download_with(self, driver: webdriver.Chrome, document: JobInstruction, download_path: Path) -> bool:
+        """Download a document using the given driver.
+
+        Args:
+            driver: Driver borrowed from the pool.
+            document: Document to download.
+            download_path: Path to save the document.
+
+        Returns:
+            True if download successful, False otherwise.
+        """
+        self._prepare_driver(driver, download_path.parent)
+
+        driver.get(document.url)
+        export_button = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.any_of(
+                EC.element_to_be_clickable(EXPORT_BUTTON_BY_TITLE),
+                EC.element_to_be_clickable(EXPORT_BUTTON_BY_TEXT)
+            )
+        )
+        export_button.click()
+
+        timeout = self.get_download_config().get("download_timeout", 30)
+        if self._wait_for_download(driver, download_path, timeout):
+            self.logger.info(f"Successfully downloaded document: {document.title}")
+            return True
+        else:
+            self.logger.warning(f"Download may have failed for: {document.title}")
+            return False
+
+    def _wait_for_download(self, driver: webdriver.Chrome, download_path: Path, timeout: float) -> bool:
+        """Wait until Chrome has finished writing the downloaded file.
+
+        Only this document's own partial file is checked, so pooled drivers
+        sharing the download directory do not wait for each other.
+
+        Args:
+            driver: WebDriver that started the download.
+            download_path: Expected path of the downloaded file.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the file is complete, False on timeout.
+        """
+        partial_paths = [download_path.with_name(download_path.name + suffix) for suffix in PARTIAL_DOWNLOAD_SUFFIXES]
+
+        def download_finished() -> bool:
+            return (
+                download_path.exists()
+                and download_path.stat().st_size > 0
+                and not any(p.exists() for p in partial_paths)
+            )
+
+        return wait_for_file_condition(download_path.parent, download_finished, timeout)
+
     def validate_document(self, file_path: Path) -> bool:
         """Validate a downloaded document.
 
@@ -2,23 +2,59 @@
 Cloud storage management for Google Drive integration.
 """
 
-import json
 import logging
-import time
+import mimetypes
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.http import MediaFileUpload
+from typing import Dict, Any, Optional, List, Set, Tuple, TYPE_CHECKING
 from googleapiclient.errors import HttpError
 
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+_CRED_CACHE: Dict[Tuple[str, str], "Credentials"] = {}
+_SERVICE_CACHE: Dict[Tuple[str, str], Any] = {}
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a literal for use inside a quoted Drive query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _build_query(name: Optional[str] = None, parent_id: Optional[str] = None,
+                 folders_only: bool = False) -> str:
+    """Build a Drive files.list query with a fixed clause order.
+
+    Args:
+        name: Exact file or folder name to match.
+        parent_id: ID of the folder the file must be in.
+        folders_only: Whether to match folders only.
+
+    Returns:
+        Query string for the q parameter.
+    """
+    clauses = []
+    if folders_only:
+        clauses.append(f"mimeType='{FOLDER_MIME_TYPE}'")
+    if name is not None:
+        clauses.append(f"name='{_escape_query_value(name)}'")
+    if parent_id:
+        clauses.append(f"'{_escape_query_value(parent_id)}' in parents")
+    clauses.append("trashed=false")
+    return " and ".join(clauses)
+
 
 class GoogleDriveManager:
     """Manages Google Drive operations for document upload."""
 
     SCOPES = ['https://www.googleapis.com/auth/drive.file']
+    FOLDER_CACHE_SIZE = 1024
+    RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
     def __init__(self, config: Dict[str, Any]):
         """Initialize the Google Drive manager.
@@ -29,7 +65,13 @@ class GoogleDriveManager:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.service = None
-        self.credentials = None
+        self.credentials: Optional["Credentials"] = None
+        self._thread_local = threading.local()
+        self._folder_cache: "OrderedDict[Tuple[Optional[str], str], str]" = OrderedDict()
+        self._folder_cache_lock = threading.Lock()
+        self._root_folders: Optional[Dict[str, str]] = None
+        self._folder_files: Dict[str, Set[str]] = {}
+        self._folder_files_lock = threading.Lock()
 
     def authenticate(self, credentials_path: Optional[str] = None) -> bool:
         """Authenticate with Google Drive API.
@@ -45,20 +87,36 @@ class GoogleDriveManager:
                 cloud_config = self.config.get("cloud_storage", {})
                 credentials_path = cloud_config.get("credentials_path", "config/credentials.json")
 
-            creds = None
             token_path = "config/token.json"
+            cache_key = (str(credentials_path), token_path)
+
+            cached_creds = _CRED_CACHE.get(cache_key)
+            if cached_creds is not None and cached_creds.valid and cache_key in _SERVICE_CACHE:
+                self.credentials = cached_creds
+                self.service = _SERVICE_CACHE[cache_key]
+                self.logger.debug("Reusing cached Google Drive credentials")
+                return True
+
+            from google.auth.transport.requests import Request
+            from google.oauth2.credentials import Credentials
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            from googleapiclient.discovery import build
+
+            creds = None
 
             if Path(token_path).exists():
                 creds = Credentials.from_authorized_user_file(token_path, self.SCOPES)
 
             if not creds or not creds.valid:
+                token_before = creds.token if creds else None
+
                 if creds and creds.expired and creds.refresh_token:
                     creds.refresh(Request())
                 else:
                     if not credentials_path:
                         self.logger.error("Credentials path not specified")
                         return False
-                    
+
                     if not Path(credentials_path).exists():
                         self.logger.error(f"Credentials file not found: {credentials_path}")
                         return False
@@ -67,11 +125,14 @@ class GoogleDriveManager:
                         credentials_path, self.SCOPES)
                     creds = flow.run_local_server(port=0)
 
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
+                if creds.token != token_before:
+                    with open(token_path, 'w') as token:
+                        token.write(creds.to_json())
 
-            self.service = build('drive', 'v3', credentials=creds)
+            self.service = build('drive', 'v3', credentials=creds, cache_discovery=False, static_discovery=True)
             self.credentials = creds
+            _CRED_CACHE[cache_key] = creds
+            _SERVICE_CACHE[cache_key] = self.service
             self.logger.info("Google Drive authentication successful")
             return True
 
@@ -79,6 +140,12 @@ class GoogleDriveManager:
             self.logger.error(f"Google Drive authentication failed: {e}")
             return False
 
+    @staticmethod
+    def clear_auth_cache() -> None:
+        """Forget credentials and services shared between manager instances."""
+        _CRED_CACHE.clear()
+        _SERVICE_CACHE.clear()
+
     def create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> Optional[str]:
         """Create folder in Google Drive.
 
@@ -96,7 +163,7 @@ class GoogleDriveManager:
 
             folder_metadata: Dict[str, Any] = {
                 'name': folder_name,
-                'mimeType': 'application/vnd.google-apps.folder'
+                'mimeType': FOLDER_MIME_TYPE
             }
 
             if parent_id:
@@ -105,6 +172,9 @@ class GoogleDriveManager:
             folder = self.service.files().create(body=folder_metadata, fields='id').execute()
             folder_id = folder.get('id')
 
+            if not parent_id:
+                self._root_folders = None
+
             self.logger.info(f"Created folder '{folder_name}' with ID: {folder_id}")
             return folder_id
 
@@ -127,15 +197,19 @@ class GoogleDriveManager:
                 self.logger.error("Google Drive service not initialized")
                 return None
 
-            query = f"mimeType='application/vnd.google-apps.folder' and name='{folder_name}' and trashed=false"
+            if parent_id is None:
+                folder_id = self._ensure_root_index().get(folder_name)
+                if folder_id:
+                    self.logger.info(f"Found folder '{folder_name}' with ID: {folder_id}")
+                    return folder_id
 
-            if parent_id:
-                query += f" and '{parent_id}' in parents"
+            query = _build_query(name=folder_name, parent_id=parent_id, folders_only=True)
 
             results = self.service.files().list(
                 q=query,
                 spaces='drive',
-                fields='files(id, name)'
+                fields='files(id, name)',
+                pageSize=1
             ).execute()
 
             items = results.get('files', [])
@@ -152,6 +226,41 @@ class GoogleDriveManager:
             self.logger.error(f"Failed to find folder '{folder_name}': {e}")
             return None
 
+    def _ensure_root_index(self) -> Dict[str, str]:
+        """Load the names and IDs of all top-level folders once per session.
+
+        Returns:
+            Mapping of folder name to folder ID for folders in the Drive root.
+        """
+        if self._root_folders is not None:
+            return self._root_folders
+
+        if not self.service:
+            return {}
+
+        root_folders: Dict[str, str] = {}
+        query = _build_query(parent_id='root', folders_only=True)
+        page_token = None
+
+        while True:
+            results = self.service.files().list(
+                q=query,
+                spaces='drive',
+                fields='nextPageToken, files(id, name)',
+                pageSize=1000,
+                pageToken=page_token
+            ).execute()
+
+            for folder in results.get('files', []):
+                root_folders.setdefault(folder['name'], folder['id'])
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        self._root_folders = root_folders
+        return root_folders
+
     def get_or_create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> Optional[str]:
         """Get existing folder or create if it doesn't exist.
 
@@ -162,21 +271,94 @@ class GoogleDriveManager:
         Returns:
             Folder ID if successful, None otherwise.
         """
-        folder_id = self.find_folder(folder_name, parent_id)
+        folder_id = self._get_cached_folder(folder_name, parent_id)
+        if folder_id:
+            return folder_id
+
+        folder_id = self.find_folder(folder_name, parent_id) or self.create_folder(folder_name, parent_id)
 
         if folder_id:
+            self._cache_folder(folder_name, parent_id, folder_id)
+
+        return folder_id
+
+    def _get_cached_folder(self, folder_name: str, parent_id: Optional[str]) -> Optional[str]:
+        """Look up a folder ID resolved earlier by this manager.
+
+        Args:
+            folder_name: Name of the folder.
+            parent_id: ID of parent folder, None for root.
+
+        Returns:
+            Cached folder ID or None.
+        """
+        key = (parent_id, folder_name)
+        with self._folder_cache_lock:
+            folder_id = self._folder_cache.get(key)
+            if folder_id is not None:
+                self._folder_cache.move_to_end(key)
             return folder_id
 
-        return self.create_folder(folder_name, parent_id)
+    def _cache_folder(self, folder_name: str, parent_id: Optional[str], folder_id: str) -> None:
+        """Remember a resolved folder ID, evicting the least recently used entry when full.
+
+        Args:
+            folder_name: Name of the folder.
+            parent_id: ID of parent folder, None for root.
+            folder_id: Resolved folder ID.
+        """
+        with self._folder_cache_lock:
+            self._folder_cache[(parent_id, folder_name)] = folder_id
+            self._folder_cache.move_to_end((parent_id, folder_name))
+            while len(self._folder_cache) > self.FOLDER_CACHE_SIZE:
+                self._folder_cache.popitem(last=False)
+
+    def delete_folder(self, folder_id: str) -> bool:
+        """Delete folder from Google Drive.
+
+        Args:
+            folder_id: ID of the folder to delete.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            if not self.service:
+                self.logger.error("Google Drive service not initialized")
+                return False
+
+            self.service.files().delete(fileId=folder_id).execute()
+
+            with self._folder_cache_lock:
+                stale_keys = [
+                    key for key, cached_id in self._folder_cache.items()
+                    if cached_id == folder_id or key[0] == folder_id
+                ]
+                for key in stale_keys:
+                    del self._folder_cache[key]
+
+            if self._root_folders and folder_id in self._root_folders.values():
+                self._root_folders = None
+
+            with self._folder_files_lock:
+                self._folder_files.pop(folder_id, None)
+
+            self.logger.info(f"Deleted folder with ID: {folder_id}")
+            return True
+
+        except HttpError as e:
+            self.logger.error(f"Failed to delete folder '{folder_id}': {e}")
+            return False
 
     def upload_file(self, file_path: str, folder_id: Optional[str] = None,
-                    custom_name: Optional[str] = None) -> Optional[str]:
+                    custom_name: Optional[str] = None, http: Optional[Any] = None) -> Optional[str]:
         """Upload file to Google Drive.
 
         Args:
             file_path: Path to the file to upload.
             folder_id: ID of folder to upload to. If None, uploads to root.
             custom_name: Custom name for the file. If None, uses original filename.
+            http: HTTP transport to send the request with. If None, uses the service's own.
 
         Returns:
             File ID if successful, None otherwise.
@@ -197,25 +379,95 @@ class GoogleDriveManager:
             if folder_id:
                 file_metadata['parents'] = [folder_id]
 
-            media = MediaFileUpload(file_path, resumable=True)
-
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
+            from googleapiclient.http import MediaFileUpload
+
+            file_size = file_path_obj.stat().st_size
+            mimetype = mimetypes.guess_type(file_path_obj.name)[0]
+
+            if file_size < self.RESUMABLE_THRESHOLD:
+                media = MediaFileUpload(file_path, mimetype=mimetype, resumable=False)
+                file = self.service.files().create(
+                    body=file_metadata,
+                    media_body=media,
+                    fields='id'
+                ).execute(http=http)
+            else:
+                media = MediaFileUpload(
+                    file_path, mimetype=mimetype, resumable=True, chunksize=self.UPLOAD_CHUNK_SIZE
+                )
+                request = self.service.files().create(
+                    body=file_metadata,
+                    media_body=media,
+                    fields='id'
+                )
+
+                file = None
+                while file is None:
+                    status, file = request.next_chunk(http=http)
+                    if status:
+                        self.logger.debug(f"Uploading '{file_name}': {int(status.progress() * 100)}%")
 
             file_id = file.get('id')
             self.logger.info(f"Uploaded file '{file_name}' with ID: {file_id}")
+
+            if folder_id:
+                with self._folder_files_lock:
+                    if folder_id in self._folder_files:
+                        self._folder_files[folder_id].add(file_name)
+
             return file_id
 
         except HttpError as e:
             self.logger.error(f"Failed to upload file '{file_path}': {e}")
             return None
 
+    def _get_thread_http(self) -> Any:
+        """Get an authorized HTTP transport owned by the calling thread.
+
+        httplib2 connections are not thread-safe, so each upload worker keeps its own.
+
+        Returns:
+            Authorized HTTP transport.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            import google_auth_httplib2
+            import httplib2
+
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    def upload_files(self, file_paths: List[str], folder_id: Optional[str] = None,
+                     max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """Upload several files to Google Drive concurrently.
+
+        Args:
+            file_paths: Paths of the files to upload.
+            folder_id: ID of folder to upload to. If None, uploads to root.
+            max_workers: Number of concurrent uploads. If None, uses config value.
+
+        Returns:
+            File ID or None for each file, in input order.
+        """
+        if not file_paths:
+            return []
+
+        if max_workers is None:
+            max_workers = self.config.get("cloud_storage", {}).get("max_concurrent_uploads", 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda file_path: self.upload_file(file_path, folder_id, http=self._get_thread_http()),
+                file_paths
+            ))
+
     def check_duplicate(self, file_name: str, folder_id: Optional[str] = None) -> bool:
         """Check if file with same name exists in folder.
 
+        The names in a folder are listed once and later checks for the same
+        folder are answered from that listing.
+
         Args:
             file_name: Name of the file to check.
             folder_id: ID of folder to check in. If None, checks in root.
@@ -228,15 +480,16 @@ class GoogleDriveManager:
                 self.logger.error("Google Drive service not initialized")
                 return False
 
-            query = f"name='{file_name}' and trashed=false"
-
             if folder_id:
-                query += f" and '{folder_id}' in parents"
+                return file_name in self.list_file_names(folder_id)
+
+            query = _build_query(name=file_name, parent_id=folder_id)
 
             results = self.service.files().list(
                 q=query,
                 spaces='drive',
-                fields='files(id, name)'
+                fields='files(id)',
+                pageSize=1
             ).execute()
 
             items = results.get('files', [])
@@ -247,9 +500,86 @@ class GoogleDriveManager:
             self.logger.error(f"Failed to check for duplicate '{file_name}': {e}")
             return False
 
+    def list_file_names(self, folder_id: str) -> Set[str]:
+        """Get the names of all files in a folder, listing the folder once per session.
+
+        Args:
+            folder_id: ID of the folder.
+
+        Returns:
+            Names of the files in the folder.
+
+        Raises:
+            HttpError: If the folder cannot be listed.
+        """
+        with self._folder_files_lock:
+            names = self._folder_files.get(folder_id)
+        if names is not None:
+            return names
+
+        if not self.service:
+            return set()
+
+        names = set()
+        query = _build_query(parent_id=folder_id)
+        page_token = None
+
+        while True:
+            results = self.service.files().list(
+                q=query,
+                spaces='drive',
+                fields='nextPageToken, files(name)',
+                pageSize=1000,
+                pageToken=page_token
+            ).execute()
+
+            names.update(item['name'] for item in results.get('files', []))
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        with self._folder_files_lock:
+            return self._folder_files.setdefault(folder_id, names)
+
+    def _list_folders_by_name(self, folder_names: List[str]) -> List[Dict[str, Any]]:
+        """List all folders matching any of the given names in one query.
+
+        Args:
+            folder_names: Folder names to look up.
+
+        Returns:
+            List of folder resources with id, name and parents.
+        """
+        if not self.service or not folder_names:
+            return []
+
+        name_clauses = " or ".join(f"name='{_escape_query_value(name)}'" for name in dict.fromkeys(folder_names))
+        query = f"mimeType='{FOLDER_MIME_TYPE}' and ({name_clauses}) and trashed=false"
+
+        folders: List[Dict[str, Any]] = []
+        page_token = None
+
+        while True:
+            results = self.service.files().list(
+                q=query,
+                spaces='drive',
+                fields='nextPageToken, files(id, name, parents)',
+                pageSize=1000,
+                pageToken=page_token
+            ).execute()
+
+            folders.extend(results.get('files', []))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return folders
+
     def create_folder_structure(self, folder_path: str) -> Optional[str]:
         """Create nested folder structure in Google Drive.
 
+        Existing path components are resolved with a single list request; only
+        the missing tail of the path is created.
+
         Args:
             folder_path: Path-like string with folders separated by '/'.
 
@@ -259,26 +589,58 @@ class GoogleDriveManager:
         if not folder_path:
             return None
 
-        folders = folder_path.strip('/').split('/')
-        parent_id = None
+        folders = [folder for folder in folder_path.strip('/').split('/') if folder]
+        if not folders:
+            return None
+
+        parent_id: Optional[str] = None
+        resolved = 0
 
         for folder in folders:
-            if not folder:
-                continue
+            folder_id = self._get_cached_folder(folder, parent_id)
+            if not folder_id:
+                break
+            parent_id = folder_id
+            resolved += 1
+
+        if resolved == len(folders):
+            return parent_id
+
+        remaining = folders[resolved:]
+
+        try:
+            existing = self._list_folders_by_name(remaining)
+        except HttpError as e:
+            self.logger.error(f"Failed to resolve folder structure '{folder_path}': {e}")
+            return None
 
-            folder_id = self.get_or_create_folder(folder, parent_id)
+        missing_from = len(remaining)
+
+        for index, folder in enumerate(remaining):
+            folder_id = next(
+                (
+                    item.get('id') for item in existing
+                    if item.get('name') == folder
+                    and (parent_id is None or parent_id in item.get('parents', []))
+                ),
+                None
+            )
+
+            if not folder_id:
+                missing_from = index
+                break
+
+            self._cache_folder(folder, parent_id, folder_id)
+            parent_id = folder_id
+
+        for folder in remaining[missing_from:]:
+            folder_id = self.create_folder(folder, parent_id)
 
             if not folder_id:
                 self.logger.error(f"Failed to create folder structure at '{folder}'")
                 return None
 
+            self._cache_folder(folder, parent_id, folder_id)
             parent_id = folder_id
 
         return parent_id
-
-
-def _unused_imports_stub():
-    """Temporary stub to satisfy flake8 F401 errors until CI configuration is fixed."""
-    _ = json.dumps({})
-    _ = time.time()
-    _ = List[str]
@@ -2,11 +2,23 @@
 Core downloader functionality for job instruction documents.
 """
 
+import atexit
+import itertools
+import json
 import logging
+import os
+import threading
+import queue
 import time
-import re
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable, Tuple
+from typing import List, Dict, Any, Optional, Callable, Iterator, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,20 +26,153 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.common.exceptions import TimeoutException
 
-from ..models.job_instruction import JobInstruction
+from ..models.job_instruction import JobInstruction, clean_document_name
 from ..models.department import Department
 from ..utils.config import ConfigManager
 from ..utils.error_handler import EnhancedErrorHandler
 from ..utils.structured_logger import StructuredLogger
+from ..utils.file_watcher import PARTIAL_DOWNLOAD_SUFFIXES, wait_for_file_condition
+from ..utils.rate_limiter import RateLimiter
 from .parsers.consultant_parser import ConsultantParser
-from .parsers.base_parser import BaseParser
+from .parsers.base_parser import BaseParser, WAIT_POLL_FREQUENCY
 from .validator import DocumentValidator
 from .cloud_manager import GoogleDriveManager
 
+_DRIVER_CACHE: Dict[str, List[Tuple[webdriver.Chrome, float]]] = {}
+_DRIVER_CACHE_LOCK = threading.Lock()
+
+
+def _shutdown_drivers() -> None:
+    """Quit all idle WebDriver sessions kept for reuse."""
+    with _DRIVER_CACHE_LOCK:
+        drivers = [driver for parked in _DRIVER_CACHE.values() for driver, _ in parked]
+        _DRIVER_CACHE.clear()
+
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_shutdown_drivers)
+
+
+class TabPipeline:
+    """Loads upcoming document pages in background tabs while the current one is processed.
+
+    Only the navigation is overlapped; clicks and downloads still happen one tab
+    at a time, so every downloaded file can be attributed to its document.
+    Each new tab is a separate DevTools target, so it is configured before the
+    page starts loading.
+    """
+
+    def __init__(self, driver: webdriver.Chrome, depth: int, rate_limiter: RateLimiter,
+                 configure_tab: Optional[Callable[[webdriver.Chrome], None]] = None):
+        """Initialize the pipeline.
+
+        Args:
+            driver: WebDriver whose tabs are used.
+            depth: Maximum number of pages loading in the background.
+            rate_limiter: Limiter every background navigation goes through.
+            configure_tab: Callable applying per-tab CDP settings to the selected tab.
+        """
+        self.driver = driver
+        self.depth = depth
+        self.rate_limiter = rate_limiter
+        self.configure_tab = configure_tab
+        self.logger = logging.getLogger(__name__)
+        self._tabs: Dict[str, str] = {}
+        self._current = driver.current_window_handle
+
+    def prefetch(self, urls: List[str]):
+        """Start loading the next pages in background tabs.
+
+        Args:
+            urls: Upcoming page URLs in processing order.
+        """
+        for url in urls[:self.depth]:
+            if url in self._tabs:
+                continue
+
+            try:
+                known_handles = set(self.driver.window_handles)
+                self.driver.execute_script("window.open('about:blank', '_blank');")
+                new_handles = set(self.driver.window_handles) - known_handles
+                if not new_handles:
+                    return
+
+                handle = new_handles.pop()
+                self._tabs[url] = handle
+                self.driver.switch_to.window(handle)
+                if self.configure_tab:
+                    self.configure_tab(self.driver)
+                self.rate_limiter.wait()
+                self.driver.execute_script("window.location.href = arguments[0];", url)
+            except Exception as e:
+                self.logger.debug(f"Failed to prefetch {url}: {e}")
+                self._tabs.pop(url, None)
+                return
+            finally:
+                try:
+                    self.driver.switch_to.window(self._current)
+                except Exception as e:
+                    self.logger.debug(f"Failed to switch back to the active tab: {e}")
+
+    def activate(self, url: str) -> bool:
+        """Switch to the background tab loading a page, closing the previous tab.
+
+        Args:
+            url: Page URL.
+
+        Returns:
+            True if the page was prefetched, False if it still has to be opened.
+        """
+        handle = self._tabs.pop(url, None)
+        if handle is None:
+            return False
+
+        try:
+            self.driver.switch_to.window(self._current)
+            self.driver.close()
+        except Exception as e:
+            self.logger.debug(f"Failed to close previous tab: {e}")
+
+        self.driver.switch_to.window(handle)
+        self._current = handle
+        return True
+
+    def close(self):
+        """Close all background tabs that were not used."""
+        for handle in self._tabs.values():
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception as e:
+                self.logger.debug(f"Failed to close prefetched tab: {e}")
+        self._tabs.clear()
+
+        try:
+            self.driver.switch_to.window(self._current)
+        except Exception as e:
+            self.logger.debug(f"Failed to switch back to the active tab: {e}")
+
 
 class DocumentDownloader:
     """Main downloader class for job instruction documents."""
 
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    DIRECT_DOWNLOAD_EXTENSIONS = (".doc", ".docx", ".pdf", ".rtf", ".odt")
+    MAX_DISCARDED_BODY = 64 * 1024
+    MANIFEST_FILE = ".download_manifest.json"
+    PROGRESS_INTERVAL = 0.5
+    UPLOAD_QUEUE_SIZE = 32
+    BLOCKED_URL_PATTERNS = (
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+        "*.css", "*.woff", "*.woff2", "*.ttf",
+        "*analytics*", "*googletagmanager*", "*mc.yandex.ru*",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize the downloader.
 
@@ -37,6 +182,7 @@ class DocumentDownloader:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.driver: Optional[webdriver.Chrome] = None
+        self._driver_key = ""
         self.config_manager = ConfigManager()
 
         self.total_documents = 0
@@ -46,6 +192,9 @@ class DocumentDownloader:
 
         self.progress_callback: Optional[Callable[[int, int], None]] = None
         self.status_callback: Optional[Callable[[str], None]] = None
+        self._last_status: Optional[str] = None
+        self._last_progress_report = 0.0
+        self._progress_dirty = False
 
         self.parser: Optional[BaseParser] = None
         self.validator: Optional[DocumentValidator] = None
@@ -53,56 +202,213 @@ class DocumentDownloader:
         self.error_handler = EnhancedErrorHandler(config)
         self.structured_logger = StructuredLogger(config)
 
+        self.download_directory = Path(config.get("download", {}).get("temp_directory", "downloads"))
+        self.max_concurrent_downloads = max(1, config.get("download", {}).get("max_concurrent_downloads", 3))
+        self._http = requests.Session()
+        http_adapter = HTTPAdapter(pool_connections=self.max_concurrent_downloads,
+                                   pool_maxsize=self.max_concurrent_downloads)
+        self._http.mount("http://", http_adapter)
+        self._http.mount("https://", http_adapter)
+
+        self.parallel_drivers = max(1, config.get("selenium", {}).get("parallel_drivers", 1))
+        self._stats_lock = threading.Lock()
+        self._cloud_lock = threading.Lock()
+        self._upload_queue: Optional[queue.Queue] = None
+        self._upload_thread: Optional[threading.Thread] = None
+        self.rate_limiter = RateLimiter(0)
+        self._url_cache: Dict[str, str] = {}
+        self._url_lock = threading.Lock()
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_dirty = False
+        self._site_settings: Optional[Dict[str, Any]] = None
+        self._site_settings_source: Optional[Dict[str, Any]] = None
+        self._callback_queue: Optional["queue.Queue[Tuple[Callable[..., None], Tuple[Any, ...]]]"] = None
+
     def setup_driver(self) -> bool:
-        """Setup Selenium WebDriver.
+        """Setup Selenium WebDriver, reusing an idle session with the same settings if one exists.
 
         Returns:
             True if successful, False otherwise.
         """
         try:
-            selenium_config = self.config.get("selenium", {})
+            self.driver, self._driver_key = self._acquire_driver(str(self.download_directory.absolute()))
+            return True
 
-            chrome_options = ChromeOptions()
+        except Exception as e:
+            self.logger.error(f"Failed to setup WebDriver: {e}")
+            return False
 
-            if selenium_config.get("headless", True):
-                chrome_options.add_argument("--headless")
+    def _acquire_driver(self, download_dir: str, remote_debugging: bool = True) -> Tuple[webdriver.Chrome, str]:
+        """Take an idle WebDriver with the same settings from the pool, or start a new one.
 
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-images")
-            chrome_options.add_argument("--disable-javascript")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--remote-debugging-port=9222")
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        Pooled sessions are not tied to a download directory; a reused session is
+        pointed at download_dir through CDP.
 
-            window_size = selenium_config.get("window_size", [1920, 1080])
-            chrome_options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
+        Args:
+            download_dir: Absolute path of the directory Chrome downloads into.
+            remote_debugging: Whether to open the fixed remote debugging port.
 
-            download_dir = str(Path(self.config.get("download", {}).get("temp_directory", "downloads")).absolute())
-            prefs = {
-                "download.default_directory": download_dir,
-                "download.prompt_for_download": False,
-                "download.directory_upgrade": True,
-                "safebrowsing.enabled": True
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
+        Returns:
+            Tuple of (driver, pool key). Pass both to _release_driver when done.
+        """
+        selenium_config = self.config.get("selenium", {})
+        key = json.dumps([selenium_config, remote_debugging], sort_keys=True, default=str)
+        idle_timeout = selenium_config.get("driver_idle_timeout", 600)
+
+        while True:
+            with _DRIVER_CACHE_LOCK:
+                parked = _DRIVER_CACHE.get(key)
+                cached = parked.pop() if parked else None
+
+            if cached is None:
+                break
+
+            driver, parked_at = cached
+            if time.monotonic() - parked_at > idle_timeout:
+                self._quit_driver(driver)
+            elif self._is_driver_alive(driver):
+                try:
+                    driver.execute_cdp_cmd("Page.setDownloadBehavior",
+                                           {"behavior": "allow", "downloadPath": download_dir})
+                except Exception as e:
+                    self.logger.warning(f"Failed to set download directory on pooled WebDriver: {e}")
+                    self._quit_driver(driver)
+                    continue
+                self.logger.info("Reusing existing WebDriver session")
+                return driver, key
 
-            self.driver = webdriver.Chrome(options=chrome_options)
+        driver = self._create_driver(download_dir, remote_debugging)
+        self.logger.info("WebDriver initialized successfully")
+        return driver, key
 
-            page_load_timeout = selenium_config.get("page_load_timeout", 30)
-            implicit_wait = selenium_config.get("implicit_wait", 10)
+    def _release_driver(self, driver: webdriver.Chrome, key: str):
+        """Reset a WebDriver session and park it in the pool for the next run.
 
-            self.driver.set_page_load_timeout(page_load_timeout)
-            self.driver.implicitly_wait(implicit_wait)
+        Up to selenium.parallel_drivers sessions are kept per configuration.
+        Sessions idle for longer than selenium.driver_idle_timeout are closed.
 
-            self.logger.info("WebDriver initialized successfully")
-            return True
+        Args:
+            driver: WebDriver to release.
+            key: Pool key returned by _acquire_driver.
+        """
+        try:
+            driver.delete_all_cookies()
+        except Exception as e:
+            self.logger.warning(f"Failed to reset WebDriver session, closing it: {e}")
+            self._quit_driver(driver)
+            return
 
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
         except Exception as e:
-            self.logger.error(f"Failed to setup WebDriver: {e}")
+            self.logger.debug(f"Could not clear web storage: {e}")
+
+        idle_timeout = self.config.get("selenium", {}).get("driver_idle_timeout", 600)
+        now = time.monotonic()
+        expired: List[webdriver.Chrome] = []
+        parked = False
+
+        with _DRIVER_CACHE_LOCK:
+            for sessions in _DRIVER_CACHE.values():
+                expired.extend(cached for cached, parked_at in sessions if now - parked_at > idle_timeout)
+                sessions[:] = [(cached, parked_at) for cached, parked_at in sessions if now - parked_at <= idle_timeout]
+
+            sessions = _DRIVER_CACHE.setdefault(key, [])
+            if len(sessions) < self.parallel_drivers:
+                sessions.append((driver, now))
+                parked = True
+
+        for idle_driver in expired:
+            self._quit_driver(idle_driver)
+        if not parked:
+            self._quit_driver(driver)
+
+    def _create_driver(self, download_dir: str, remote_debugging: bool = True) -> webdriver.Chrome:
+        """Start a new Chrome instance.
+
+        Args:
+            download_dir: Absolute path of the directory Chrome downloads into.
+            remote_debugging: Whether to open the fixed remote debugging port.
+
+        Returns:
+            Configured WebDriver.
+        """
+        selenium_config = self.config.get("selenium", {})
+        chrome_options = ChromeOptions()
+        chrome_options.page_load_strategy = selenium_config.get("page_load_strategy", "eager")
+
+        if selenium_config.get("headless", True):
+            chrome_options.add_argument("--headless")
+
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-javascript")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-web-security")
+        if remote_debugging:
+            chrome_options.add_argument("--remote-debugging-port=9222")
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+
+        disk_cache_dir = selenium_config.get("disk_cache_dir")
+        if disk_cache_dir:
+            chrome_options.add_argument(f"--disk-cache-dir={Path(disk_cache_dir).absolute()}")
+
+        window_size = selenium_config.get("window_size", [1920, 1080])
+        chrome_options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
+
+        prefs = {
+            "download.default_directory": download_dir,
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+            "safebrowsing.enabled": True,
+            "profile.managed_default_content_settings.images": 2
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+
+        driver = webdriver.Chrome(options=chrome_options)
+
+        page_load_timeout = selenium_config.get("page_load_timeout", 30)
+        driver.set_page_load_timeout(page_load_timeout)
+
+        self._configure_network(driver, download_dir)
+        return driver
+
+    def _configure_network(self, driver: webdriver.Chrome, download_dir: str):
+        """Block page resources the downloader never needs and pin the download directory.
+
+        Args:
+            driver: WebDriver to configure.
+            download_dir: Absolute path of the directory Chrome downloads into.
+        """
+        blocked_urls = self.config.get("selenium", {}).get("blocked_url_patterns", list(self.BLOCKED_URL_PATTERNS))
+
+        try:
+            if blocked_urls:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+            driver.execute_cdp_cmd("Page.setDownloadBehavior", {"behavior": "allow", "downloadPath": download_dir})
+        except Exception as e:
+            self.logger.debug(f"Failed to configure browser network settings: {e}")
+
+    def _is_driver_alive(self, driver: webdriver.Chrome) -> bool:
+        """Check whether a WebDriver session still responds.
+
+        Args:
+            driver: WebDriver to check.
+
+        Returns:
+            True if the session can be used, False otherwise.
+        """
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            try:
+                driver.quit()
+            except Exception:
+                pass
             return False
 
     def download_documents(
@@ -143,38 +449,38 @@ class DocumentDownloader:
                     return False
 
                 self.validator = DocumentValidator(site_config)
+                self._get_site_settings(site_config)
 
-                if not self.setup_driver():
+                if self.parallel_drivers == 1 and not self.setup_driver():
                     return False
 
                 if upload_to_cloud and not self.setup_cloud_storage():
                     self.logger.warning("Cloud storage setup failed, continuing without cloud upload")
                     upload_to_cloud = False
 
-                self.total_documents = sum(dept.total_documents for dept in departments)
+                if upload_to_cloud:
+                    self._start_uploader()
+
+                enabled_departments = [department for department in departments if department.enabled]
+
+                self.total_documents = sum(department.total_documents for department in enabled_departments)
                 self.completed_documents = 0
                 self.failed_documents = 0
                 self.start_time = time.time()
+                self._last_status = None
+                self._last_progress_report = 0.0
 
                 self._update_status(f"Начинаем загрузку {self.total_documents} документов")
 
-                for department in departments:
-                    if not department.enabled:
-                        continue
-
-                    self._update_status(f"Обрабатываем отдел: {department.name}")
-                    self.structured_logger.log_operation(
-                        self.logger, "info", f"Processing department: {department.name}",
-                        operation="process_department", department=department.name
-                    )
-
-                    success = self._process_department(department, site_config, upload_to_cloud)
-                    if not success:
-                        self.structured_logger.log_operation(
-                            self.logger, "warning", f"Failed to process department: {department.name}",
-                            operation="process_department", department=department.name
-                        )
+                success = True
+                if self.parallel_drivers > 1:
+                    success = self._process_departments_parallel(enabled_departments, site_config, upload_to_cloud)
+                else:
+                    for department in enabled_departments:
+                        self._run_department(department, site_config, upload_to_cloud, self.driver)
 
+                self._stop_uploader()
+                self._flush_progress()
                 self._update_status("Загрузка завершена")
                 self.structured_logger.log_operation(
                     self.logger, "info",
@@ -182,7 +488,7 @@ class DocumentDownloader:
                     operation="download_complete"
                 )
 
-                return True
+                return success
 
         except Exception as e:
             self.structured_logger.log_operation(
@@ -193,207 +499,807 @@ class DocumentDownloader:
             return False
 
         finally:
+            self._stop_uploader()
             self.cleanup()
 
+    def _run_department(self, department: Department, site_config: Dict[str, Any], upload_to_cloud: bool,
+                        driver: Optional[webdriver.Chrome], download_dir: Optional[Path] = None) -> bool:
+        """Process a department and log the outcome.
+
+        Args:
+            department: Department to process.
+            site_config: Site configuration.
+            upload_to_cloud: Whether to upload documents to cloud storage.
+            driver: WebDriver to use for this department.
+            download_dir: Directory the driver downloads into. If None, uses the configured one.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        self._update_status(f"Обрабатываем отдел: {department.name}")
+        self.structured_logger.log_operation(
+            self.logger, "info", f"Processing department: {department.name}",
+            operation="process_department", department=department.name
+        )
+
+        success = self._process_department(department, site_config, upload_to_cloud, driver, download_dir)
+        if not success:
+            self.structured_logger.log_operation(
+                self.logger, "warning", f"Failed to process department: {department.name}",
+                operation="process_department", department=department.name
+            )
+        return success
+
+    def _process_departments_parallel(self, departments: List[Department], site_config: Dict[str, Any],
+                                      upload_to_cloud: bool) -> bool:
+        """Process departments concurrently, one Chrome instance per worker.
+
+        Workers first extract each department's documents and fetch those that
+        need no browser. The remaining documents are then queued one by one, so
+        a large department is spread over all drivers. Callbacks raised by the
+        workers are delivered on the calling thread.
+
+        Args:
+            departments: Departments to process.
+            site_config: Site configuration.
+            upload_to_cloud: Whether to upload documents to cloud storage.
+
+        Returns:
+            True if every worker task finished, False if any of them raised.
+        """
+        self._callback_queue = queue.Queue()
+
+        def prepare(department: Department) -> List[JobInstruction]:
+            driver, download_dir = get_driver()
+            self._update_status(f"Обрабатываем отдел: {department.name}")
+            documents = self._prepare_department(department, site_config, driver)
+            if documents is None:
+                self.structured_logger.log_operation(
+                    self.logger, "warning", f"Failed to process department: {department.name}",
+                    operation="process_department", department=department.name
+                )
+                return []
+
+            browser_documents = []
+            for job_instruction, static_result in documents:
+                if static_result is None:
+                    browser_documents.append(job_instruction)
+                else:
+                    self._download_document(department, job_instruction, static_result, site_config,
+                                            upload_to_cloud, driver, download_dir)
+            return browser_documents
+
+        def download(department: Department, job_instruction: JobInstruction):
+            driver, download_dir = get_driver()
+            self._download_document(department, job_instruction, None, site_config,
+                                    upload_to_cloud, driver, download_dir)
+
+        success = True
+
+        try:
+            with self._chrome_pool() as get_driver, \
+                    ThreadPoolExecutor(max_workers=self.parallel_drivers) as executor:
+                preparing = {executor.submit(prepare, department): department for department in departments}
+                downloading: Dict["Future[Any]", Tuple[Department, JobInstruction]] = {}
+                pending = set(preparing)
+
+                while pending:
+                    done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        error = future.exception()
+                        if future in preparing:
+                            department = preparing.pop(future)
+                            if error is not None:
+                                success = False
+                                self._record_worker_failure(department, department.job_instructions or [], error)
+                                continue
+                            for job_instruction in future.result():
+                                download_future = executor.submit(download, department, job_instruction)
+                                downloading[download_future] = (department, job_instruction)
+                                pending.add(download_future)
+                        else:
+                            department, job_instruction = downloading.pop(future)
+                            if error is not None:
+                                success = False
+                                self._record_worker_failure(department, [job_instruction], error)
+                    self._flush_progress()
+                    self._drain_callbacks()
+        finally:
+            self._drain_callbacks()
+            self._callback_queue = None
+
+        return success
+
+    def _record_worker_failure(self, department: Department, job_instructions: List[JobInstruction],
+                               error: BaseException):
+        """Log a crashed worker task and count its unfinished documents as failed.
+
+        Args:
+            department: Department the task was processing.
+            job_instructions: Documents the task was responsible for.
+            error: Exception raised by the task.
+        """
+        self.structured_logger.log_operation(
+            self.logger, "error", f"Worker failed for department {department.name}: {error}",
+            operation="process_department", department=department.name
+        )
+
+        failed = [ji for ji in job_instructions if ji.status not in ("completed", "failed")]
+        for job_instruction in failed:
+            job_instruction.status = "failed"
+            job_instruction.error_message = str(error)
+
+        with self._stats_lock:
+            self.failed_documents += len(failed)
+        self._update_progress()
+
+    @contextmanager
+    def _chrome_pool(self) -> Iterator[Callable[[], Tuple[webdriver.Chrome, Path]]]:
+        """Provide one Chrome instance per worker thread, reused across departments.
+
+        Each instance downloads into its own subdirectory so workers never see
+        each other's files. The instances are returned to the driver pool
+        afterwards so the next run can reuse them.
+
+        Yields:
+            Callable returning the calling thread's driver and download directory.
+        """
+        local = threading.local()
+        drivers: List[Tuple[webdriver.Chrome, str]] = []
+        lock = threading.Lock()
+        worker_ids = itertools.count()
+        base_dir = self.download_directory.absolute()
+
+        def get_driver() -> Tuple[webdriver.Chrome, Path]:
+            if not hasattr(local, "driver"):
+                with lock:
+                    download_dir = base_dir / f"worker-{next(worker_ids)}"
+                download_dir.mkdir(parents=True, exist_ok=True)
+                driver, key = self._acquire_driver(str(download_dir), remote_debugging=False)
+                with lock:
+                    drivers.append((driver, key))
+                local.driver = driver
+                local.download_dir = download_dir
+            return local.driver, local.download_dir
+
+        try:
+            yield get_driver
+        finally:
+            for driver, key in drivers:
+                self._release_driver(driver, key)
+
+    def _drain_callbacks(self):
+        """Run callbacks queued by worker threads."""
+        if self._callback_queue is None:
+            return
+
+        while True:
+            try:
+                callback, args = self._callback_queue.get_nowait()
+            except queue.Empty:
+                return
+            callback(*args)
+
     def _process_department(self, department: Department, site_config: Dict[str, Any],
-                            upload_to_cloud: bool = True) -> bool:
+                            upload_to_cloud: bool = True, driver: Optional[webdriver.Chrome] = None,
+                            download_dir: Optional[Path] = None) -> bool:
         """Process a single department.
 
         Args:
             department: Department to process.
             site_config: Site configuration.
             upload_to_cloud: Whether to upload documents to cloud storage.
+            driver: WebDriver to use. If None, uses the downloader's own driver.
+            download_dir: Directory the driver downloads into. If None, uses the configured one.
 
         Returns:
             True if successful, False otherwise.
         """
+        driver = driver or self.driver
+
+        try:
+            documents = self._prepare_department(department, site_config, driver)
+            if documents is None:
+                return False
+
+            with self.structured_logger.timed_operation(
+                self.logger, "info", f"Processing department {department.name}",
+                operation="process_department", department=department.name
+            ):
+                browser_urls = [
+                    job_instruction.url for job_instruction, static_result in documents if static_result is None
+                ]
+                pipeline = self._create_tab_pipeline(driver, download_dir) if browser_urls else None
+
+                for job_instruction, static_result in documents:
+                    if static_result is None:
+                        browser_urls.pop(0)
+                        if pipeline:
+                            pipeline.prefetch(browser_urls)
+
+                    self._download_document(department, job_instruction, static_result, site_config,
+                                            upload_to_cloud, driver, download_dir, pipeline)
+
+                if pipeline:
+                    pipeline.close()
+
+                return True
+
+        except Exception as e:
+            self.structured_logger.log_operation(
+                self.logger, "error", f"Error processing department {department.name}: {e}",
+                operation="process_department", department=department.name
+            )
+            return False
+
+    def _prepare_department(
+        self, department: Department, site_config: Dict[str, Any], driver: Optional[webdriver.Chrome]
+    ) -> Optional[List[Tuple[JobInstruction, Optional[Tuple[bool, Optional[str]]]]]]:
+        """Extract a department's documents and download those that need no browser.
+
+        Args:
+            department: Department to prepare.
+            site_config: Site configuration.
+            driver: WebDriver used to extract the document list.
+
+        Returns:
+            Pairs of job instruction and download result, where the result is None
+            for documents that still have to be downloaded in the browser. None if
+            the department could not be processed.
+        """
         try:
             if not department.job_instructions:
-                if not self.driver or not self.parser:
+                if not driver or not self.parser:
                     self.logger.warning(f"Cannot extract job instructions for department: {department.name}")
-                    return False
+                    return None
 
-                department.job_instructions = self.extract_department_documents(department)
+                department.job_instructions = self.extract_department_documents(department, driver)
+                with self._stats_lock:
+                    self.total_documents += len(department.job_instructions)
 
                 if not department.job_instructions:
                     self.structured_logger.log_operation(
                         self.logger, "warning", f"No job instructions found for department: {department.name}",
                         operation="process_department", department=department.name
                     )
-                    return True
+                    return []
+
+            cached_results = [self._reuse_cached_download(ji) for ji in department.job_instructions]
+            fetched_results = iter(self._fetch_documents_static(
+                [ji for ji, cached in zip(department.job_instructions, cached_results) if cached is None],
+                site_config
+            ))
+            static_results = [
+                cached if cached is not None else next(fetched_results) for cached in cached_results
+            ]
+            return list(zip(department.job_instructions, static_results))
 
-            with self.structured_logger.timed_operation(
-                self.logger, "info", f"Processing department {department.name}",
+        except Exception as e:
+            self.structured_logger.log_operation(
+                self.logger, "error", f"Error processing department {department.name}: {e}",
                 operation="process_department", department=department.name
-            ):
-                for job_instruction in department.job_instructions:
-                    try:
-                        self._update_status(f"Загружаем: {job_instruction.title}")
+            )
+            return None
 
-                        download_result = self.error_handler.retry_with_backoff(
-                            self._download_single_document,
-                            job_instruction, site_config
-                        )
+    def _download_document(self, department: Department, job_instruction: JobInstruction,
+                           static_result: Optional[Tuple[bool, Optional[str]]], site_config: Dict[str, Any],
+                           upload_to_cloud: bool, driver: Optional[webdriver.Chrome],
+                           download_dir: Optional[Path], pipeline: Optional[TabPipeline] = None):
+        """Download a document in the browser if needed, upload it and record the outcome.
 
-                        if download_result[0]:  # Success
-                            job_instruction.status = "completed"
-                            job_instruction.local_path = download_result[1]
-
-                            if upload_to_cloud and self.cloud_manager and job_instruction.local_path:
-                                cloud_success = self.upload_to_cloud(
-                                    job_instruction.local_path,
-                                    department.name,
-                                    job_instruction.title
-                                )
-
-                                if cloud_success:
-                                    job_instruction.cloud_status = "uploaded"
-                                    self.structured_logger.log_operation(
-                                        self.logger, "info", f"Uploaded to cloud: {job_instruction.title}",
-                                        operation="cloud_upload", department=department.name,
-                                        document_title=job_instruction.title
-                                    )
-                                else:
-                                    job_instruction.cloud_status = "failed"
-                                    self.structured_logger.log_operation(
-                                        self.logger, "error", f"Failed to upload to cloud: {job_instruction.title}",
-                                        operation="cloud_upload", department=department.name,
-                                        document_title=job_instruction.title
-                                    )
-
-                            self.completed_documents += 1
-                            self.structured_logger.log_operation(
-                                self.logger, "info", f"Successfully downloaded: {job_instruction.title}",
-                                operation="download_document", department=department.name,
-                                document_title=job_instruction.title
-                            )
-                        else:
-                            job_instruction.status = "failed"
-                            self.failed_documents += 1
-                            self.structured_logger.log_operation(
-                                self.logger, "error", f"Failed to download: {job_instruction.title}",
-                                operation="download_document", department=department.name,
-                                document_title=job_instruction.title
-                            )
-
-                        if self.progress_callback:
-                            self.progress_callback(self.completed_documents, self.total_documents)
-
-                        delay = site_config.get("site_config", {}).get(
-                            "rate_limiting", {}
-                        ).get("delay_between_requests", 3)
-                        time.sleep(delay)
-
-                    except Exception as e:
-                        self.structured_logger.log_operation(
-                            self.logger, "error", f"Error processing document {job_instruction.title}: {e}",
-                            operation="download_document", department=department.name,
-                            document_title=job_instruction.title
-                        )
-                        job_instruction.status = "failed"
-                        job_instruction.error_message = str(e)
-                        self.failed_documents += 1
+        Args:
+            department: Department the document belongs to.
+            job_instruction: Job instruction to download.
+            static_result: Result of the HTTP fetch, or None if the browser is needed.
+            site_config: Site configuration.
+            upload_to_cloud: Whether to upload the document to cloud storage.
+            driver: WebDriver to use for the browser download.
+            download_dir: Directory the driver downloads into. If None, uses the configured one.
+            pipeline: Tab pipeline that may already be loading the document page.
+        """
+        try:
+            self._update_status(f"Загружаем: {job_instruction.title}")
+
+            download_result = static_result
+            if download_result is None:
+                download_result = self._reuse_cached_download(job_instruction)
+            if download_result is None:
+                download_result = self._download_single_document(
+                    job_instruction, site_config, driver, download_dir, pipeline
+                )
 
-                return True
+            if download_result[0]:  # Success
+                job_instruction.status = "completed"
+                job_instruction.local_path = download_result[1]
+                self._remember_download(job_instruction.url, job_instruction.local_path)
+
+                if upload_to_cloud and self.cloud_manager and job_instruction.local_path:
+                    upload = (job_instruction.local_path, department.name, job_instruction)
+                    if self._upload_queue is not None:
+                        self._upload_queue.put(upload)
+                    else:
+                        self._upload_document(*upload)
+
+                with self._stats_lock:
+                    self.completed_documents += 1
+                self.structured_logger.log_operation(
+                    self.logger, "info", f"Successfully downloaded: {job_instruction.title}",
+                    operation="download_document", department=department.name,
+                    document_title=job_instruction.title
+                )
+            else:
+                job_instruction.status = "failed"
+                with self._stats_lock:
+                    self.failed_documents += 1
+                self.structured_logger.log_operation(
+                    self.logger, "error", f"Failed to download: {job_instruction.title}",
+                    operation="download_document", department=department.name,
+                    document_title=job_instruction.title
+                )
+
+            self._update_progress()
 
         except Exception as e:
             self.structured_logger.log_operation(
-                self.logger, "error", f"Error processing department {department.name}: {e}",
-                operation="process_department", department=department.name
+                self.logger, "error", f"Error processing document {job_instruction.title}: {e}",
+                operation="download_document", department=department.name,
+                document_title=job_instruction.title
             )
-            return False
+            job_instruction.status = "failed"
+            job_instruction.error_message = str(e)
+            with self._stats_lock:
+                self.failed_documents += 1
 
-    def _download_single_document(self, job_instruction: JobInstruction,
-                                  site_config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-        """Download a single document.
+    def _upload_document(self, file_path: str, department_name: str, job_instruction: JobInstruction):
+        """Upload a downloaded document and record its cloud status.
+
+        Args:
+            file_path: Path of the downloaded file.
+            department_name: Name of the department the document belongs to.
+            job_instruction: Downloaded job instruction.
+        """
+        with self._cloud_lock:
+            cloud_success = self.upload_to_cloud(
+                file_path,
+                department_name,
+                job_instruction.title
+            )
+
+        if cloud_success:
+            job_instruction.cloud_status = "uploaded"
+            self.structured_logger.log_operation(
+                self.logger, "info", f"Uploaded to cloud: {job_instruction.title}",
+                operation="cloud_upload", department=department_name,
+                document_title=job_instruction.title
+            )
+        else:
+            job_instruction.cloud_status = "failed"
+            self.structured_logger.log_operation(
+                self.logger, "error", f"Failed to upload to cloud: {job_instruction.title}",
+                operation="cloud_upload", department=department_name,
+                document_title=job_instruction.title
+            )
+
+    def _start_uploader(self):
+        """Start the thread that uploads finished documents while the next ones download."""
+        self._upload_queue = queue.Queue(maxsize=self.UPLOAD_QUEUE_SIZE)
+        self._upload_thread = threading.Thread(
+            target=self._run_uploader, args=(self._upload_queue,), name="cloud-uploader", daemon=True
+        )
+        self._upload_thread.start()
+
+    def _run_uploader(self, upload_queue: queue.Queue):
+        """Upload queued documents until the stop marker is received.
+
+        Args:
+            upload_queue: Queue of _upload_document arguments, ended by None.
+        """
+        while True:
+            item = upload_queue.get()
+            if item is None:
+                return
+
+            try:
+                self._upload_document(*item)
+            except Exception as e:
+                self.logger.error(f"Background upload failed: {e}")
+
+    def _stop_uploader(self):
+        """Wait for queued uploads to finish and stop the uploader thread."""
+        if self._upload_queue is None or self._upload_thread is None:
+            return
+
+        self._upload_queue.put(None)
+        self._upload_thread.join()
+        self._upload_queue = None
+        self._upload_thread = None
+
+    def _reuse_cached_download(self, job_instruction: JobInstruction) -> Optional[Tuple[bool, Optional[str]]]:
+        """Reuse a file downloaded earlier in this session from the same URL.
 
         Args:
             job_instruction: Job instruction to download.
+
+        Returns:
+            Tuple of (True, file_path) if the URL was already downloaded, None otherwise.
+        """
+        with self._url_lock:
+            cached_path = self._url_cache.get(job_instruction.url)
+
+        if not cached_path or not Path(cached_path).exists():
+            return None
+
+        target = self.download_directory / self._generate_filename(job_instruction.title)
+
+        try:
+            if target.resolve() != Path(cached_path).resolve():
+                target.unlink(missing_ok=True)
+                try:
+                    os.link(cached_path, target)
+                except OSError:
+                    shutil.copy2(cached_path, target)
+        except OSError as e:
+            self.logger.warning(f"Failed to reuse download of {job_instruction.url}: {e}")
+            return None
+
+        self.structured_logger.log_operation(
+            self.logger, "info", f"Reused earlier download: {job_instruction.title}",
+            operation="download_document", document_title=job_instruction.title
+        )
+        return True, str(target)
+
+    def _remember_download(self, url: str, file_path: Optional[str]):
+        """Record the local file downloaded from a URL.
+
+        Args:
+            url: Document URL.
+            file_path: Path of the downloaded file.
+        """
+        if file_path:
+            with self._url_lock:
+                self._url_cache[url] = file_path
+
+    def _get_site_settings(self, site_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the site settings used on every document, resolved once per site configuration.
+
+        Args:
             site_config: Site configuration.
 
         Returns:
-            Tuple of (success, file_path). If success is False, file_path will be None.
+            Dictionary with the request delay, download button locator and download timeout.
+        """
+        if self._site_settings is not None and self._site_settings_source is site_config:
+            return self._site_settings
+
+        settings = site_config.get("site_config", {})
+        extraction = settings.get("document_extraction", {})
+
+        delay = float(settings.get("rate_limiting", {}).get("delay_between_requests", 3))
+        if self.rate_limiter.base_interval != delay:
+            self.rate_limiter = RateLimiter(delay)
+
+        self._site_settings = {
+            "delay": delay,
+            "download_button": (By.CSS_SELECTOR, extraction.get("download_button_selector", "[devinid='14']")),
+            "download_timeout": extraction.get("download_timeout", 30),
+        }
+        self._site_settings_source = site_config
+        return self._site_settings
+
+    def _fetch_documents_static(self, job_instructions: List[JobInstruction],
+                                site_config: Dict[str, Any]) -> List[Optional[Tuple[bool, Optional[str]]]]:
+        """Download documents that are served directly over HTTP, several at a time.
+
+        Only documents with a known direct file URL are requested; document
+        pages are left to the browser without an HTTP probe.
+
+        Args:
+            job_instructions: Job instructions to download.
+            site_config: Site configuration.
+
+        Returns:
+            Download result for each job instruction, in input order. None means the
+            document is not a direct download and has to be fetched with the browser.
+        """
+        if not job_instructions:
+            return []
+
+        self._get_site_settings(site_config)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as executor:
+            return list(executor.map(self._fetch_document_static, job_instructions))
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds.
+
+        Args:
+            value: Header value.
+
+        Returns:
+            Number of seconds to wait, or None if the header is missing or not a number.
         """
         try:
-            if not self.driver:
-                self.logger.error("WebDriver not initialized")
-                return False, None
+            return max(0.0, float(value)) if value else None
+        except ValueError:
+            return None
 
-            with self.structured_logger.timed_operation(
-                self.logger, "info", f"Downloading document: {job_instruction.title}",
-                operation="download_document", document_title=job_instruction.title
-            ):
-                self.driver.get(job_instruction.url)
+    def _direct_download_url(self, job_instruction: JobInstruction, entry: Dict[str, Any]) -> Optional[str]:
+        """Get the URL a document can be downloaded from without the browser.
 
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
+        Args:
+            job_instruction: Job instruction to download.
+            entry: Manifest entry of the document page.
 
-                download_selector = site_config.get("site_config", {}).get(
-                    "document_extraction", {}
-                ).get("download_button_selector", "[devinid='14']")
+        Returns:
+            Download URL from the document metadata or the manifest, the page URL
+            itself if it points at a document file, or None if no direct URL is known.
+        """
+        download_url = (job_instruction.metadata or {}).get("download_url")
+        if download_url:
+            return str(download_url)
 
-                try:
-                    download_button = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, download_selector))
-                    )
-                    download_button.click()
+        if entry.get("html_page"):
+            return None
 
-                    download_timeout = site_config.get("site_config", {}).get(
-                        "document_extraction", {}
-                    ).get("download_timeout", 30)
+        if entry.get("download_url"):
+            return str(entry["download_url"])
 
-                    time.sleep(5)  # Initial wait
+        if urlsplit(job_instruction.url).path.lower().endswith(self.DIRECT_DOWNLOAD_EXTENSIONS):
+            return job_instruction.url
 
-                    download_dir = Path(self.config.get("download", {}).get("temp_directory", "downloads"))
-                    download_dir.mkdir(parents=True, exist_ok=True)
+        return None
 
-                    max_wait_time = time.time() + download_timeout
-                    downloaded_file = None
+    def _discard_body(self, response: requests.Response):
+        """Read a small unwanted response body so its connection can be reused.
 
-                    while time.time() < max_wait_time:
-                        files = list(download_dir.glob("*"))
-                        if files:
-                            downloaded_file = max(files, key=lambda f: f.stat().st_mtime)
+        Args:
+            response: Streamed response that will not be saved.
+        """
+        length = response.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) <= self.MAX_DISCARDED_BODY:
+            try:
+                _ = response.content
+            except requests.RequestException:
+                pass
 
-                            if (not downloaded_file.name.endswith('.crdownload') and
-                                    not downloaded_file.name.endswith('.part')):
-                                break
+    def _fetch_document_static(self, job_instruction: JobInstruction, url: Optional[str] = None,
+                               cookies: Optional[Dict[str, str]] = None) -> Optional[Tuple[bool, Optional[str]]]:
+        """Download a single document with a plain HTTP request.
 
-                        time.sleep(1)
+        Args:
+            job_instruction: Job instruction to download.
+            url: URL to fetch. If None, uses the known direct download URL, if any.
+            cookies: Cookies to send with the request.
 
-                    if not downloaded_file:
-                        self.structured_logger.log_operation(
-                            self.logger, "error", f"Download timeout for: {job_instruction.title}",
-                            operation="download_document", document_title=job_instruction.title
-                        )
-                        return False, None
+        Returns:
+            Tuple of (success, file_path), or None if no direct URL is known or the
+            URL serves an HTML page rather than the document itself.
+        """
+        download_config = self.config.get("download", {})
+        file_path = self.download_directory / self._generate_filename(job_instruction.title)
 
-                    if self.validator and not self.validator.validate_document_structure(str(downloaded_file)):
-                        self.structured_logger.log_operation(
-                            self.logger, "error", f"Downloaded file validation failed: {job_instruction.title}",
-                            operation="validate_document", document_title=job_instruction.title
-                        )
-                        return False, None
+        entry = self._get_manifest_entry(job_instruction.url)
+        probing = url is None
+        url = url or self._direct_download_url(job_instruction, entry)
+        if url is None:
+            return None
 
-                    clean_filename = self._generate_filename(job_instruction.title)
-                    new_file_path = download_dir / clean_filename
-                    downloaded_file.rename(new_file_path)
+        headers = {}
+        if entry.get("download_url") == url and file_path.exists() and file_path.stat().st_size > 0:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
 
+        try:
+            self.rate_limiter.wait()
+            with self._http.get(url, timeout=download_config.get("timeout", 30),
+                                cookies=cookies, headers=headers, stream=True) as response:
+                if response.status_code == 304 and headers:
                     self.structured_logger.log_operation(
-                        self.logger, "info", f"Successfully downloaded and validated: {job_instruction.title}",
+                        self.logger, "info", f"Document unchanged, skipping download: {job_instruction.title}",
                         operation="download_document", document_title=job_instruction.title
                     )
+                    return True, str(file_path)
 
-                    return True, str(new_file_path)
+                if response.status_code == 429:
+                    self._discard_body(response)
+                    self.rate_limiter.backoff(self._parse_retry_after(response.headers.get("Retry-After")))
+                    self.logger.warning(f"Rate limited by server, slowing down to one request every "
+                                        f"{self.rate_limiter.interval:.1f}s")
+                    return None
 
-                except TimeoutException:
+                content_type = response.headers.get("Content-Type", "")
+                if response.status_code != 200 or content_type.startswith("text/html"):
+                    self._discard_body(response)
+                    if probing and content_type.startswith("text/html"):
+                        self._set_manifest_entry(job_instruction.url, {"html_page": True})
+                    return None
+
+                self.rate_limiter.relax()
+
+                self.download_directory.mkdir(parents=True, exist_ok=True)
+                partial_path = file_path.with_name(file_path.name + ".part")
+
+                try:
+                    with open(partial_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                    partial_path.replace(file_path)
+                finally:
+                    partial_path.unlink(missing_ok=True)
+
+        except requests.RequestException as e:
+            self.logger.debug(f"Direct download failed for {url}: {e}")
+            return None
+        except OSError as e:
+            self.logger.error(f"Failed to save {job_instruction.title}: {e}")
+            return False, None
+
+        if self.validator and not self.validator.validate_document_structure(str(file_path)).get("valid"):
+            self.structured_logger.log_operation(
+                self.logger, "error", f"Downloaded file validation failed: {job_instruction.title}",
+                operation="validate_document", document_title=job_instruction.title
+            )
+            return False, None
+
+        self._set_manifest_entry(job_instruction.url, {
+            "download_url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        })
+
+        self.structured_logger.log_operation(
+            self.logger, "info", f"Successfully downloaded and validated: {job_instruction.title}",
+            operation="download_document", document_title=job_instruction.title
+        )
+        return True, str(file_path)
+
+    def _manifest_path(self) -> Path:
+        """Get the path of the manifest recording what was downloaded from where.
+
+        Returns:
+            Manifest file path inside the download directory.
+        """
+        return self.download_directory / self.MANIFEST_FILE
+
+    def _get_manifest_entry(self, page_url: str) -> Dict[str, Any]:
+        """Get the recorded download URL and cache validators for a document page.
+
+        Args:
+            page_url: Document page URL.
+
+        Returns:
+            Manifest entry, empty if the document was never downloaded directly.
+        """
+        with self._url_lock:
+            if self._manifest is None:
+                try:
+                    with open(self._manifest_path(), 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+                    self._manifest = manifest if isinstance(manifest, dict) else {}
+                except (OSError, ValueError):
+                    self._manifest = {}
+            entry = self._manifest.get(page_url)
+            return dict(entry) if isinstance(entry, dict) else {}
+
+    def _set_manifest_entry(self, page_url: str, entry: Dict[str, Any]):
+        """Record the download URL and cache validators for a document page.
+
+        Args:
+            page_url: Document page URL.
+            entry: Manifest entry.
+        """
+        with self._url_lock:
+            if self._manifest is None:
+                self._manifest = {}
+            self._manifest[page_url] = entry
+            self._manifest_dirty = True
+
+    def _save_manifest(self):
+        """Write the download manifest if it changed."""
+        with self._url_lock:
+            if not self._manifest_dirty or self._manifest is None:
+                return
+            manifest = dict(self._manifest)
+            self._manifest_dirty = False
+
+        try:
+            path = self._manifest_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False)
+        except OSError as e:
+            self.logger.warning(f"Failed to save download manifest: {e}")
+
+    def _download_single_document(self, job_instruction: JobInstruction, site_config: Dict[str, Any],
+                                  driver: Optional[webdriver.Chrome] = None,
+                                  download_dir: Optional[Path] = None,
+                                  pipeline: Optional[TabPipeline] = None) -> Tuple[bool, Optional[str]]:
+        """Download a single document.
+
+        Args:
+            job_instruction: Job instruction to download.
+            site_config: Site configuration.
+            driver: WebDriver to use. If None, uses the downloader's own driver.
+            download_dir: Directory the driver downloads into. If None, uses the configured one.
+            pipeline: Tab pipeline that may already be loading the document page.
+
+        Returns:
+            Tuple of (success, file_path). If success is False, file_path will be None.
+        """
+        driver = driver or self.driver
+
+        try:
+            if not driver:
+                self.logger.error("WebDriver not initialized")
+                return False, None
+
+            with self.structured_logger.timed_operation(
+                self.logger, "info", f"Downloading document: {job_instruction.title}",
+                operation="download_document", document_title=job_instruction.title
+            ):
+                if not (pipeline and pipeline.activate(job_instruction.url)):
+                    self.rate_limiter.wait()
+                    driver.get(job_instruction.url)
+
+                site_settings = self._get_site_settings(site_config)
+
+                download_button = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.element_to_be_clickable(site_settings["download_button"])
+                )
+
+                download_url = self._resolve_download_url(job_instruction, download_button)
+                if download_url:
+                    cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+                    static_result = self._fetch_document_static(job_instruction, download_url, cookies)
+                    if static_result is not None:
+                        return static_result
+
+                download_timeout = site_settings["download_timeout"]
+
+                output_dir = self.download_directory
+                output_dir.mkdir(parents=True, exist_ok=True)
+                watch_dir = download_dir or output_dir
+                existing_files = set(os.listdir(watch_dir))
+
+                download_button.click()
+
+                downloaded_file = self._wait_for_new_file(watch_dir, existing_files, download_timeout)
+
+                if not downloaded_file:
                     self.structured_logger.log_operation(
-                        self.logger, "error", f"Download button not found for: {job_instruction.title}",
+                        self.logger, "error", f"Download timeout for: {job_instruction.title}",
                         operation="download_document", document_title=job_instruction.title
                     )
                     return False, None
 
+                if self.validator and \
+                        not self.validator.validate_document_structure(str(downloaded_file)).get("valid"):
+                    self.structured_logger.log_operation(
+                        self.logger, "error", f"Downloaded file validation failed: {job_instruction.title}",
+                        operation="validate_document", document_title=job_instruction.title
+                    )
+                    return False, None
+
+                clean_filename = self._generate_filename(job_instruction.title)
+                new_file_path = output_dir / clean_filename
+                downloaded_file.replace(new_file_path)
+
+                self.structured_logger.log_operation(
+                    self.logger, "info", f"Successfully downloaded and validated: {job_instruction.title}",
+                    operation="download_document", document_title=job_instruction.title
+                )
+
+                return True, str(new_file_path)
+
+        except TimeoutException:
+            self.structured_logger.log_operation(
+                self.logger, "error", f"Download button not found for: {job_instruction.title}",
+                operation="download_document", document_title=job_instruction.title
+            )
+            return False, None
+
         except Exception as e:
             self.structured_logger.log_operation(
                 self.logger, "error", f"Error downloading document: {e}",
@@ -401,25 +1307,174 @@ class DocumentDownloader:
             )
             return False, None
 
+    def _create_tab_pipeline(self, driver: Optional[webdriver.Chrome],
+                             download_dir: Optional[Path] = None) -> Optional[TabPipeline]:
+        """Create a tab pipeline for a driver if prefetching is enabled.
+
+        Args:
+            driver: WebDriver that will download the documents.
+            download_dir: Directory the driver downloads into. If None, uses the configured one.
+
+        Returns:
+            Tab pipeline, or None if prefetching is disabled or unavailable.
+        """
+        depth = self.config.get("selenium", {}).get("prefetch_tabs", 1)
+        if not driver or depth < 1:
+            return None
+
+        tab_download_dir = str((download_dir or self.download_directory).absolute())
+
+        try:
+            return TabPipeline(driver, depth, self.rate_limiter,
+                               lambda tab_driver: self._configure_network(tab_driver, tab_download_dir))
+        except Exception as e:
+            self.logger.debug(f"Tab prefetching unavailable: {e}")
+            return None
+
+    def _resolve_download_url(self, job_instruction: JobInstruction, download_button: Any) -> Optional[str]:
+        """Read the file URL behind a download button and remember it on the job instruction.
+
+        Later runs fetch the cached URL directly without opening the page in the browser.
+
+        Args:
+            job_instruction: Job instruction being downloaded.
+            download_button: Download button element.
+
+        Returns:
+            Absolute HTTP(S) download URL, or None if the button does not link to a file.
+        """
+        href: Optional[str] = download_button.get_attribute("href")
+        if not href or not href.startswith(("http://", "https://")):
+            return None
+
+        if job_instruction.metadata is None:
+            job_instruction.metadata = {}
+        job_instruction.metadata["download_url"] = href
+        return href
+
+    def _wait_for_new_file(self, download_dir: Path, existing_files: Set[str],
+                           timeout: float) -> Optional[Path]:
+        """Wait for the browser to finish writing a new file into the download directory.
+
+        Args:
+            download_dir: Directory the browser downloads into.
+            existing_files: Names of files present before the download started.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Path of the downloaded file, or None on timeout.
+        """
+        found: List[Path] = []
+
+        def download_finished() -> bool:
+            with os.scandir(download_dir) as entries:
+                new_files = [entry for entry in entries if entry.name not in existing_files]
+            if not new_files or any(entry.name.endswith(PARTIAL_DOWNLOAD_SUFFIXES) for entry in new_files):
+                return False
+            try:
+                if len(new_files) == 1:
+                    newest = new_files[0]
+                else:
+                    newest = max(new_files, key=lambda entry: entry.stat().st_mtime)
+                if newest.stat().st_size == 0:
+                    return False
+            except OSError:
+                return False
+            found[:] = [Path(newest.path)]
+            return True
+
+        if wait_for_file_condition(download_dir, download_finished, timeout):
+            return found[0]
+        return None
+
     def _update_status(self, message: str):
-        """Update status via callback.
+        """Update status via callback, skipping repeats of the previous message.
 
         Args:
             message: Status message.
         """
-        if self.status_callback:
-            self.status_callback(message)
+        if not self.status_callback:
+            return
+
+        with self._stats_lock:
+            if message == self._last_status:
+                return
+            self._last_status = message
+
+        self._post_callback(self.status_callback, message)
+
+    def _update_progress(self, force: bool = False):
+        """Report download progress via callback, at most once per PROGRESS_INTERVAL.
+
+        Args:
+            force: Whether to report pending progress regardless of the interval.
+        """
+        if not self.progress_callback:
+            return
+
+        with self._stats_lock:
+            self._progress_dirty = True
+            now = time.monotonic()
+            if not force and now - self._last_progress_report < self.PROGRESS_INTERVAL:
+                return
+            self._progress_dirty = False
+            self._last_progress_report = now
+            completed = self.completed_documents
+
+        self._post_callback(self.progress_callback, completed, self.total_documents)
+
+    def _flush_progress(self):
+        """Report progress that was held back by the update interval."""
+        if self._progress_dirty:
+            self._update_progress(force=True)
+
+    def _post_callback(self, callback: Callable[..., None], *args: Any):
+        """Run a callback now, or queue it for the main thread while workers are running.
+
+        Args:
+            callback: Callback to run.
+            *args: Arguments for the callback.
+        """
+        if self._callback_queue is not None:
+            self._callback_queue.put((callback, args))
+        else:
+            callback(*args)
 
     def cleanup(self):
-        """Cleanup resources."""
-        if self.driver:
-            try:
-                self.driver.quit()
-                self.logger.info("WebDriver closed")
-            except Exception as e:
-                self.logger.error(f"Error closing WebDriver: {e}")
-            finally:
-                self.driver = None
+        """Cleanup resources.
+
+        The WebDriver session is kept open for the next download run; call
+        shutdown() to close it.
+        """
+        self._save_manifest()
+        self._http.close()
+
+        if not self.driver:
+            return
+
+        driver = self.driver
+        self.driver = None
+        self._release_driver(driver, self._driver_key)
+
+    def shutdown(self):
+        """Cleanup resources and close the WebDriver session."""
+        driver = self.driver
+        self.driver = None
+        self.cleanup()
+        if driver:
+            self._quit_driver(driver)
+
+    def _quit_driver(self, driver: webdriver.Chrome):
+        """Close a WebDriver session.
+
+        Args:
+            driver: WebDriver to close.
+        """
+        try:
+            driver.quit()
+            self.logger.info("WebDriver closed")
+        except Exception as e:
+            self.logger.error(f"Error closing WebDriver: {e}")
 
     def get_download_statistics(self) -> Dict[str, Any]:
         """Get download statistics.
@@ -591,30 +1646,26 @@ class DocumentDownloader:
         Returns:
             Clean filename with .docx extension.
         """
-        clean_title = re.sub(r'[^\w\s-]', '', document_title)
-        clean_title = re.sub(r'[-\s]+', '-', clean_title)
-        clean_title = clean_title.strip('-')
-
-        if len(clean_title) > 100:
-            clean_title = clean_title[:100]
-
-        return f"{clean_title}.docx"
+        return f"{clean_document_name(document_title)}.docx"
 
-    def extract_department_documents(self, department: Department) -> List[JobInstruction]:
+    def extract_department_documents(self, department: Department,
+                                     driver: Optional[webdriver.Chrome] = None) -> List[JobInstruction]:
         """Extract documents for a department using the configured parser.
 
         Args:
             department: Department to extract documents for.
+            driver: WebDriver to use. If None, uses the downloader's own driver.
 
         Returns:
             List of extracted job instructions.
         """
-        if not self.parser or not self.driver:
+        driver = driver or self.driver
+        if not self.parser or not driver:
             self.logger.error("Parser or driver not initialized")
             return []
 
         try:
-            return self.parser.extract_documents(self.driver, department)
+            return self.parser.extract_documents(driver, department)
         except Exception as e:
             self.structured_logger.log_operation(
                 self.logger, "error", f"Failed to extract documents for {department.name}: {e}",
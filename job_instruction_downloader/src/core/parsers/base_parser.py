@@ -2,6 +2,7 @@
 Base parser class for universal document extraction.
 """
 
+import re
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 from selenium import webdriver
@@ -9,6 +10,12 @@ from selenium import webdriver
 from ...models.job_instruction import JobInstruction
 from ...models.department import Department
 
+WAIT_POLL_FREQUENCY = 0.05
+
+
+class NeedsJavaScript(Exception):
+    """Raised when a page cannot be parsed without a browser."""
+
 
 class BaseParser(ABC):
     """Base class for all site parsers."""
@@ -22,6 +29,27 @@ class BaseParser(ABC):
         self.config = config
         self.site_config = config.get("site_config", {})
 
+        extraction = self.site_config.get("extraction", {})
+        selectors = extraction.get("selectors", {})
+        self._selectors: Dict[str, str] = selectors if isinstance(selectors, dict) else {}
+
+        rate_limits = self.site_config.get("rate_limiting", {})
+        self._rate_limits: Dict[str, Any] = rate_limits if isinstance(rate_limits, dict) else {}
+
+        download_config = self.site_config.get("download", {})
+        self._download_config: Dict[str, Any] = download_config if isinstance(download_config, dict) else {}
+
+        validation_config = self._download_config.get("validation", {})
+        self._validation_config: Dict[str, Any] = validation_config if isinstance(validation_config, dict) else {}
+
+        title_config = extraction.get("title_processing", {})
+        self._title_prefixes = tuple(title_config.get("remove_prefixes", []))
+        self._title_suffixes = tuple(title_config.get("remove_suffixes", []))
+        self._title_max_length = title_config.get("max_length", 100)
+        cleanup_regex = title_config.get("cleanup_regex", r"\s+")
+        self._title_cleanup = re.compile(cleanup_regex) if cleanup_regex else None
+        self._title_replacement = title_config.get("replacement", " ")
+
     @abstractmethod
     def extract_documents(self, driver: webdriver.Chrome, department: Department) -> List[JobInstruction]:
         """Extract job instruction documents for a department.
@@ -53,8 +81,7 @@ class BaseParser(ABC):
         Returns:
             Dictionary of CSS selectors.
         """
-        selectors = self.site_config.get("extraction", {}).get("selectors", {})
-        return selectors if isinstance(selectors, dict) else {}
+        return self._selectors
 
     def get_rate_limits(self) -> Dict[str, Any]:
         """Get rate limiting configuration.
@@ -62,8 +89,7 @@ class BaseParser(ABC):
         Returns:
             Rate limiting configuration dictionary.
         """
-        rate_limits = self.site_config.get("rate_limiting", {})
-        return rate_limits if isinstance(rate_limits, dict) else {}
+        return self._rate_limits
 
     def get_download_config(self) -> Dict[str, Any]:
         """Get download configuration.
@@ -71,8 +97,7 @@ class BaseParser(ABC):
         Returns:
             Download configuration dictionary.
         """
-        download_config = self.site_config.get("download", {})
-        return download_config if isinstance(download_config, dict) else {}
+        return self._download_config
 
     def get_validation_config(self) -> Dict[str, Any]:
         """Get validation configuration.
@@ -80,8 +105,7 @@ class BaseParser(ABC):
         Returns:
             Validation configuration dictionary.
         """
-        validation_config = self.get_download_config().get("validation", {})
-        return validation_config if isinstance(validation_config, dict) else {}
+        return self._validation_config
 
     def process_title(self, title: str) -> str:
         """Process and clean document title.
@@ -95,26 +119,20 @@ class BaseParser(ABC):
         if not title:
             return ""
 
-        title_config = self.site_config.get("extraction", {}).get("title_processing", {})
-
-        remove_prefixes = title_config.get("remove_prefixes", [])
-        for prefix in remove_prefixes:
-            if title.startswith(prefix):
-                title = title[len(prefix):].strip()
+        if self._title_prefixes and title.startswith(self._title_prefixes):
+            for prefix in self._title_prefixes:
+                if title.startswith(prefix):
+                    title = title[len(prefix):].strip()
 
-        remove_suffixes = title_config.get("remove_suffixes", [])
-        for suffix in remove_suffixes:
-            if title.endswith(suffix):
-                title = title[:-len(suffix)].strip()
+        if self._title_suffixes and title.endswith(self._title_suffixes):
+            for suffix in self._title_suffixes:
+                if title.endswith(suffix):
+                    title = title[:-len(suffix)].strip()
 
-        max_length = title_config.get("max_length", 100)
-        if len(title) > max_length:
-            title = title[:max_length].strip()
+        if len(title) > self._title_max_length:
+            title = title[:self._title_max_length].strip()
 
-        cleanup_regex = title_config.get("cleanup_regex", r"\s+")
-        replacement = title_config.get("replacement", " ")
-        if cleanup_regex:
-            import re
-            title = re.sub(cleanup_regex, replacement, title)
+        if self._title_cleanup:
+            title = self._title_cleanup.sub(self._title_replacement, title)
 
         return title.strip()
@@ -3,17 +3,37 @@ Consultant.ru specific parser implementation.
 """
 
 import logging
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from bs4 import BeautifulSoup
+from requests import Session
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
-from .base_parser import BaseParser
+from .base_parser import BaseParser, NeedsJavaScript, WAIT_POLL_FREQUENCY
 from ...models.job_instruction import JobInstruction
 from ...models.department import Department
+from ..validator import has_expected_header
+
+_ONCLICK_URL = re.compile(r"location\.href\s*=\s*['\"]([^'\"]+)['\"]")
+
+# Reads title, href and onclick of every document element in a single WebDriver command.
+_READ_LINKS_SCRIPT = """
+const titleSelector = arguments[1];
+const pageTitle = document.querySelector(titleSelector);
+return arguments[0].map(function (element) {
+    const titleElement = element.querySelector(titleSelector) || pageTitle || element;
+    return [
+        (titleElement.innerText || "").trim(),
+        element.href || element.getAttribute("href"),
+        element.getAttribute("onclick")
+    ];
+});
+"""
 
 
 class ConsultantParser(BaseParser):
@@ -28,6 +48,16 @@ class ConsultantParser(BaseParser):
         super().__init__(config)
         self.logger = logging.getLogger(__name__)
 
+        self._document_selector = self._selectors.get("document_links", "[devinid]")
+        self._title_selector = self._selectors.get("document_title", "h1, .document-title")
+
+        self._min_size = self._validation_config.get("min_size", 30000)
+        self._max_size = self._validation_config.get("max_size", 10485760)
+        self._check_content = self._validation_config.get("check_content", False)
+        self._expected_types = frozenset(
+            file_type.lower() for file_type in self._download_config.get("expected_file_types", [".docx", ".doc"])
+        )
+
     def extract_documents(self, driver: webdriver.Chrome, department: Department) -> List[JobInstruction]:
         """Extract job instruction documents for a department from Consultant.ru.
 
@@ -39,7 +69,6 @@ class ConsultantParser(BaseParser):
             List of extracted job instructions.
         """
         documents = []
-        selectors = self.get_selectors()
 
         try:
             start_url = self.site_config.get("navigation", {}).get("start_url", "")
@@ -50,37 +79,33 @@ class ConsultantParser(BaseParser):
                 return []
 
             full_url = f"{base_url}{start_url}"
-            self.logger.info(f"Navigating to: {full_url}")
-            driver.get(full_url)
+            if driver.current_url == full_url:
+                self.logger.info(f"Reusing loaded page: {full_url}")
+            else:
+                self.logger.info(f"Navigating to: {full_url}")
+                driver.get(full_url)
 
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-
-            document_selector = selectors.get("document_links", "[devinid]")
+            document_selector = self._document_selector
             self.logger.info(f"Looking for documents with selector: {document_selector}")
 
-            document_elements = driver.find_elements(By.CSS_SELECTOR, document_selector)
+            try:
+                document_elements = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, document_selector))
+                )
+            except TimeoutException:
+                document_elements = []
             self.logger.info(f"Found {len(document_elements)} potential document elements")
 
-            for i, element in enumerate(document_elements):
-                try:
-                    title = self._extract_title(driver, element)
-                    url = self._extract_url(element, base_url)
-
-                    if title and url:
-                        processed_title = self.process_title(title)
-                        job_instruction = JobInstruction(
-                            title=processed_title,
-                            department=department.name,
-                            url=url
-                        )
-                        documents.append(job_instruction)
-                        self.logger.debug(f"Extracted document {i+1}: {processed_title}")
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract document {i+1}: {e}")
-                    continue
+            for i, (title, url) in enumerate(self._read_links(driver, document_elements, base_url)):
+                if title and url:
+                    processed_title = self.process_title(title)
+                    job_instruction = JobInstruction(
+                        title=processed_title,
+                        department=department.name,
+                        url=url
+                    )
+                    documents.append(job_instruction)
+                    self.logger.debug(f"Extracted document {i+1}: {processed_title}")
 
             self.logger.info(f"Successfully extracted {len(documents)} documents for {department.name}")
             return documents
@@ -89,31 +114,133 @@ class ConsultantParser(BaseParser):
             self.logger.error(f"Failed to extract documents for {department.name}: {e}")
             return []
 
-    def _extract_title(self, driver: webdriver.Chrome, element) -> str:
-        """Extract document title from element.
+    def extract_documents_static(self, session: Session, department: Department) -> List[JobInstruction]:
+        """Extract job instruction documents from the static HTML of the listing page.
+
+        Args:
+            session: HTTP session used to fetch the page.
+            department: Department to extract documents for.
+
+        Returns:
+            List of extracted job instructions.
+
+        Raises:
+            NeedsJavaScript: If the page has to be rendered in a browser.
+        """
+        start_url = self.site_config.get("navigation", {}).get("start_url", "")
+        base_url = self.site_config.get("site_info", {}).get("base_url", "")
+
+        if not start_url or not base_url:
+            self.logger.warning(f"Missing URL configuration for {department.name}")
+            return []
+
+        full_url = f"{base_url}{start_url}"
+        self.logger.info(f"Fetching static page: {full_url}")
+        response = session.get(full_url, timeout=30)
+
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code != 200 or "html" not in content_type:
+            raise NeedsJavaScript(f"Unexpected response {response.status_code} ({content_type}) from {full_url}")
+
+        soup = BeautifulSoup(response.text, "lxml")
+        document_selector = self._document_selector
+        document_elements = soup.select(document_selector)
+
+        if not document_elements:
+            raise NeedsJavaScript(f"No elements match '{document_selector}' in static HTML of {full_url}")
+
+        title_selector = self._title_selector
+        page_title = soup.select_one(title_selector)
+        documents = []
+
+        for i, element in enumerate(document_elements):
+            title_element = element.select_one(title_selector) or page_title
+            title = (title_element or element).get_text().strip()
+            url = self._resolve_url(element.get("href"), element.get("onclick"), base_url)
+
+            if title and url:
+                processed_title = self.process_title(title)
+                documents.append(JobInstruction(
+                    title=processed_title,
+                    department=department.name,
+                    url=url
+                ))
+                self.logger.debug(f"Extracted document {i+1}: {processed_title}")
+
+        self.logger.info(f"Successfully extracted {len(documents)} documents for {department.name} from static HTML")
+        return documents
+
+    def _read_links(self, driver: webdriver.Chrome, elements: List[Any], base_url: str) -> List[Tuple[str, str]]:
+        """Read titles and URLs of document elements.
+
+        Reads all elements with one script execution, and falls back to
+        querying them one by one if the script fails.
 
         Args:
             driver: Selenium WebDriver instance.
-            element: Web element containing document information.
+            elements: Document link elements.
+            base_url: Base URL for the site.
 
         Returns:
-            Document title or empty string if not found.
+            List of (title, url) tuples. Missing values are empty strings.
         """
+        if not elements:
+            return []
+
         try:
-            selectors = self.get_selectors()
-            title_selector = selectors.get("document_title", "h1, .document-title")
+            rows = driver.execute_script(_READ_LINKS_SCRIPT, elements, self._title_selector)
+            if isinstance(rows, list) and len(rows) == len(elements):
+                return [(title or "", self._resolve_url(href, onclick, base_url)) for title, href, onclick in rows]
+            self.logger.debug("Unexpected link script result, reading elements one by one")
+        except Exception as e:
+            self.logger.debug(f"Link script failed, reading elements one by one: {e}")
 
+        page_title = self._read_page_title(driver)
+        links = []
+        for i, element in enumerate(elements):
             try:
-                title_element = element.find_element(By.CSS_SELECTOR, title_selector)
-                text = title_element.text
+                links.append((self._extract_title(element, page_title), self._extract_url(element, base_url)))
+            except Exception as e:
+                self.logger.warning(f"Failed to extract document {i+1}: {e}")
+        return links
+
+    def _read_page_title(self, driver: webdriver.Chrome) -> Optional[str]:
+        """Read the page-level title used for elements without their own title.
+
+        Args:
+            driver: Selenium WebDriver instance.
+
+        Returns:
+            Page title, or None if the page has no title element.
+        """
+        try:
+            title_elements = driver.find_elements(By.CSS_SELECTOR, self._title_selector)
+            if title_elements:
+                text = title_elements[0].text
                 return text.strip() if text else ""
-            except NoSuchElementException:
-                try:
-                    title_element = driver.find_element(By.CSS_SELECTOR, title_selector)
-                    text = title_element.text
-                    return text.strip() if text else ""
-                except NoSuchElementException:
-                    return element.text.strip() if element.text else ""
+        except Exception as e:
+            self.logger.warning(f"Failed to extract page title: {e}")
+        return None
+
+    def _extract_title(self, element, page_title: Optional[str] = None) -> str:
+        """Extract document title from element.
+
+        Args:
+            element: Web element containing document information.
+            page_title: Page-level title used if the element has no title of its own.
+
+        Returns:
+            Document title or empty string if not found.
+        """
+        try:
+            title_elements = element.find_elements(By.CSS_SELECTOR, self._title_selector)
+            if title_elements:
+                text = title_elements[0].text
+            elif page_title is not None:
+                return page_title
+            else:
+                text = element.text
+            return text.strip() if text else ""
 
         except Exception as e:
             self.logger.warning(f"Failed to extract title: {e}")
@@ -131,31 +258,43 @@ class ConsultantParser(BaseParser):
         """
         try:
             href = element.get_attribute("href")
-            if href and isinstance(href, str):
-                if href.startswith("http"):
-                    return str(href)
-                elif href.startswith("/"):
-                    return f"{base_url}{href}"
-                else:
-                    return f"{base_url}/{href}"
-
-            onclick = element.get_attribute("onclick")
-            if onclick and isinstance(onclick, str) and "location.href" in onclick:
-                import re
-                url_match = re.search(r"location\.href\s*=\s*['\"]([^'\"]+)['\"]", onclick)
-                if url_match:
-                    url = url_match.group(1)
-                    if isinstance(url, str):
-                        if url.startswith("/"):
-                            return f"{base_url}{url}"
-                        return url
-
-            return ""
+            onclick = None if href and isinstance(href, str) else element.get_attribute("onclick")
+            return self._resolve_url(href, onclick, base_url)
 
         except Exception as e:
             self.logger.warning(f"Failed to extract URL: {e}")
             return ""
 
+    def _resolve_url(self, href: Optional[Any], onclick: Optional[Any], base_url: str) -> str:
+        """Build a full document URL from link attributes.
+
+        Args:
+            href: Value of the href attribute.
+            onclick: Value of the onclick attribute.
+            base_url: Base URL for the site.
+
+        Returns:
+            Full document URL or empty string if not found.
+        """
+        if href and isinstance(href, str):
+            if href.startswith("http"):
+                return str(href)
+            elif href.startswith("/"):
+                return f"{base_url}{href}"
+            else:
+                return f"{base_url}/{href}"
+
+        if onclick and isinstance(onclick, str) and "location.href" in onclick:
+            url_match = _ONCLICK_URL.search(onclick)
+            if url_match:
+                url = url_match.group(1)
+                if isinstance(url, str):
+                    if url.startswith("/"):
+                        return f"{base_url}{url}"
+                    return url
+
+        return ""
+
     def validate_document(self, file_path: str) -> bool:
         """Validate downloaded document from Consultant.ru.
 
@@ -168,30 +307,25 @@ class ConsultantParser(BaseParser):
         try:
             path = Path(file_path)
 
-            if not path.exists():
+            try:
+                file_size = path.stat().st_size
+            except FileNotFoundError:
                 self.logger.error(f"File does not exist: {file_path}")
                 return False
 
-            validation_config = self.get_validation_config()
-
-            file_size = path.stat().st_size
-            min_size = validation_config.get("min_size", 30000)
-            max_size = validation_config.get("max_size", 10485760)
-
-            if file_size < min_size:
-                self.logger.error(f"File too small: {file_size} < {min_size}")
+            if file_size < self._min_size:
+                self.logger.error(f"File too small: {file_size} < {self._min_size}")
                 return False
 
-            if file_size > max_size:
-                self.logger.error(f"File too large: {file_size} > {max_size}")
+            if file_size > self._max_size:
+                self.logger.error(f"File too large: {file_size} > {self._max_size}")
                 return False
 
-            expected_types = self.get_download_config().get("expected_file_types", [".docx", ".doc"])
-            if expected_types and path.suffix.lower() not in expected_types:
+            if self._expected_types and path.suffix.lower() not in self._expected_types:
                 self.logger.error(f"Invalid file type: {path.suffix}")
                 return False
 
-            if validation_config.get("check_content", False):
+            if self._check_content:
                 return self._validate_content(file_path)
 
             return True
@@ -210,17 +344,7 @@ class ConsultantParser(BaseParser):
             True if content is valid, False otherwise.
         """
         try:
-            path = Path(file_path)
-
-            if path.suffix.lower() in [".docx", ".doc"]:
-                with open(file_path, 'rb') as f:
-                    header = f.read(8)
-                    if path.suffix.lower() == ".docx":
-                        return header.startswith(b'PK')
-                    elif path.suffix.lower() == ".doc":
-                        return header.startswith(b'\xd0\xcf\x11\xe0')
-
-            return True
+            return has_expected_header(file_path)
 
         except Exception as e:
             self.logger.warning(f"Content validation failed for {file_path}: {e}")
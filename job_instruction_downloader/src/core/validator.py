@@ -3,8 +3,39 @@ Document validation functionality.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+MAGIC_BYTES = {
+    ".docx": b"PK",
+    ".doc": b"\xd0\xcf\x11\xe0",
+    ".pdf": b"%PDF",
+}
+
+
+def has_expected_header(file_path: str) -> bool:
+    """Check that a document starts with the signature of its file type.
+
+    Args:
+        file_path: Path to the file to check.
+
+    Returns:
+        True if the header matches or the file type has no known signature.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    magic = MAGIC_BYTES.get(Path(file_path).suffix.lower())
+    if magic is None:
+        return True
+
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        header = os.read(fd, 8)
+    finally:
+        os.close(fd)
+    return header.startswith(magic)
 
 
 class DocumentValidator:
@@ -32,11 +63,12 @@ class DocumentValidator:
         try:
             path = Path(file_path)
 
-            if not path.exists():
+            try:
+                file_size = path.stat().st_size
+            except FileNotFoundError:
                 self.logger.error(f"File does not exist: {file_path}")
                 return False
 
-            file_size = path.stat().st_size
             min_size = validation_config.get("min_size", 0)
             max_size = validation_config.get("max_size", float('inf'))
 
@@ -72,22 +104,7 @@ class DocumentValidator:
             True if content is valid, False otherwise.
         """
         try:
-            path = Path(file_path)
-
-            if path.suffix.lower() in [".docx", ".doc"]:
-                with open(file_path, 'rb') as f:
-                    header = f.read(8)
-                    if path.suffix.lower() == ".docx":
-                        return header.startswith(b'PK')
-                    elif path.suffix.lower() == ".doc":
-                        return header.startswith(b'\xd0\xcf\x11\xe0')
-
-            elif path.suffix.lower() == ".pdf":
-                with open(file_path, 'rb') as f:
-                    header = f.read(4)
-                    return header == b'%PDF'
-
-            return True
+            return has_expected_header(file_path)
 
         except Exception as e:
             self.logger.warning(f"Content validation failed for {file_path}: {e}")
@@ -114,16 +131,18 @@ class DocumentValidator:
         try:
             path = Path(file_path)
 
-            if not path.exists():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
                 errors.append("File does not exist")
                 return result
 
-            result["file_size"] = path.stat().st_size
+            result["file_size"] = stat.st_size
             result["file_type"] = path.suffix.lower()
 
             if self._validate_content(file_path):
                 result["valid"] = True
-                result["metadata"] = self._extract_metadata(file_path)
+                result["metadata"] = self._extract_metadata(file_path, stat)
             else:
                 errors.append("Invalid file content")
 
@@ -132,11 +151,12 @@ class DocumentValidator:
 
         return result
 
-    def _extract_metadata(self, file_path: str) -> Dict[str, Any]:
+    def _extract_metadata(self, file_path: str, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Extract metadata from document.
 
         Args:
             file_path: Path to the file.
+            stat: Result of stat() on the file, if already known.
 
         Returns:
             Dictionary with extracted metadata.
@@ -145,7 +165,8 @@ class DocumentValidator:
 
         try:
             path = Path(file_path)
-            stat = path.stat()
+            if stat is None:
+                stat = path.stat()
 
             metadata.update({
                 "file_name": path.name,
@@ -3,7 +3,8 @@ Main window GUI for the Job Instruction Downloader application.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -11,7 +12,7 @@ from PyQt6.QtWidgets import (
     QLabel, QTextEdit, QSplitter, QGroupBox,
     QStatusBar, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 
 GUI_FRAMEWORK = "PyQt6"
@@ -24,6 +25,9 @@ class MainWindow(QMainWindow):
     download_paused = pyqtSignal()
     download_stopped = pyqtSignal()
 
+    LOG_FLUSH_INTERVAL_MS = 100
+    MAX_LOG_LINES = 1000
+
     def __init__(self, config: Dict[str, Any], parent: Optional[QWidget] = None):
         """Initialize main window.
 
@@ -35,6 +39,12 @@ class MainWindow(QMainWindow):
         self.config = config
         self.logger = logging.getLogger(__name__)
 
+        self._log_buffer: List[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self.flush_log)
+
         self.setup_ui()
         self.setup_menu()
         self.setup_status_bar()
@@ -140,6 +150,7 @@ class MainWindow(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(200)
+        self.log_text.document().setMaximumBlockCount(self.MAX_LOG_LINES)
 
         log_layout.addWidget(self.log_text)
         layout.addWidget(log_group)
@@ -148,10 +159,10 @@ class MainWindow(QMainWindow):
 
     def populate_sources_tree(self):
         """Populate the sources tree with sample data."""
-        consultant_item = QTreeWidgetItem(self.sources_tree)
-        consultant_item.setText(0, "Consultant.ru")
-        consultant_item.setText(1, "63 документа")
-        consultant_item.setCheckState(0, Qt.CheckState.Checked)
+        checked = Qt.CheckState.Checked
+
+        consultant_item = QTreeWidgetItem(["Consultant.ru", "63 документа"])
+        consultant_item.setCheckState(0, checked)
 
         departments = [
             ("ПЛАНОВО-ЭКОНОМИЧЕСКИЙ ОТДЕЛ", "15"),
@@ -161,13 +172,19 @@ class MainWindow(QMainWindow):
             ("ОХРАНА ТРУДА", "17")
         ]
 
+        dept_items = []
         for dept_name, count in departments:
-            dept_item = QTreeWidgetItem(consultant_item)
-            dept_item.setText(0, dept_name)
-            dept_item.setText(1, count)
-            dept_item.setCheckState(0, Qt.CheckState.Checked)
-
-        consultant_item.setExpanded(True)
+            dept_item = QTreeWidgetItem([dept_name, count])
+            dept_item.setCheckState(0, checked)
+            dept_items.append(dept_item)
+        consultant_item.addChildren(dept_items)
+
+        self.sources_tree.setUpdatesEnabled(False)
+        try:
+            self.sources_tree.addTopLevelItem(consultant_item)
+            consultant_item.setExpanded(True)
+        finally:
+            self.sources_tree.setUpdatesEnabled(True)
 
     def setup_menu(self):
         """Setup the menu bar."""
@@ -251,13 +268,23 @@ class MainWindow(QMainWindow):
             self.download_stopped.emit()
 
     def log_message(self, message: str):
-        """Add a message to the log output."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.log_text.append(formatted_message)
+        """Add a message to the log output.
+
+        Messages are buffered and appended to the log view together at most
+        every LOG_FLUSH_INTERVAL_MS, so bursts of messages cause one layout pass.
+        """
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
         self.logger.info(message)
 
+    def flush_log(self):
+        """Append buffered messages to the log output."""
+        if self._log_buffer:
+            self.log_text.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
     def show_settings(self):
         """Show settings dialog."""
         QMessageBox.information(self, "Настройки", "Диалог настроек будет реализован в следующей версии")
@@ -2,6 +2,7 @@
 Main entry point for the Job Instruction Downloader application.
 """
 
+import importlib.util
 import sys
 import logging
 from pathlib import Path
@@ -12,29 +13,28 @@ from job_instruction_downloader.src.utils.config import ConfigManager
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+GUI_FRAMEWORKS = ("PyQt6", "PySide6")
+
 
 def main():
     """Main application entry point."""
     try:
-        setup_logging()
+        setup_logging(use_queue=True)
         logger = logging.getLogger(__name__)
         logger.info("Starting Job Instruction Downloader")
 
         config_manager = ConfigManager()
         config = config_manager.load_config()
 
-        from job_instruction_downloader.src.gui.main_window import MainWindow
+        gui_framework = next((name for name in GUI_FRAMEWORKS if importlib.util.find_spec(name)), None)
+        if gui_framework is None:
+            logger.error("Neither PyQt6 nor PySide6 is available. Please install one of them.")
+            return 1
 
-        try:
+        if gui_framework == "PyQt6":
             from PyQt6.QtWidgets import QApplication
-            gui_framework = "PyQt6"
-        except ImportError:
-            try:
-                from PySide6.QtWidgets import QApplication
-                gui_framework = "PySide6"
-            except ImportError:
-                logger.error("Neither PyQt6 nor PySide6 is available. Please install one of them.")
-                return 1
+        else:
+            from PySide6.QtWidgets import QApplication
 
         logger.info(f"Using {gui_framework} for GUI")
 
@@ -42,6 +42,8 @@ def main():
         app.setApplicationName("Job Instruction Downloader")
         app.setApplicationVersion("1.0.0")
 
+        from job_instruction_downloader.src.gui.main_window import MainWindow
+
         main_window = MainWindow(config)
         main_window.show()
 
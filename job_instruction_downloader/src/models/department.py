@@ -2,14 +2,15 @@
 Data model for department information.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .job_instruction import JobInstruction
 
 
-@dataclass
+@dataclass(slots=True)
 class Department:
     """Represents a department with job instructions."""
 
@@ -18,35 +19,30 @@ class Department:
     folder_name: str
     priority: int = 1
     enabled: bool = True
-    job_instructions: Optional[List["JobInstruction"]] = None
-    metadata: Optional[Dict[str, Any]] = None
-
-    def __post_init__(self):
-        """Post-initialization processing."""
-        if self.job_instructions is None:
-            self.job_instructions = []
-
-        if self.metadata is None:
-            self.metadata = {}
+    job_instructions: List["JobInstruction"] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def total_documents(self) -> int:
         """Get total number of documents in department."""
         return len(self.job_instructions) if self.job_instructions else 0
 
+    @property
+    def status_counts(self) -> "Counter[str]":
+        """Get number of documents per status, counted in a single pass."""
+        if not self.job_instructions:
+            return Counter()
+        return Counter(ji.status for ji in self.job_instructions)
+
     @property
     def completed_documents(self) -> int:
         """Get number of completed downloads."""
-        if not self.job_instructions:
-            return 0
-        return sum(1 for ji in self.job_instructions if ji.status == "completed")
+        return self.status_counts["completed"]
 
     @property
     def failed_documents(self) -> int:
         """Get number of failed downloads."""
-        if not self.job_instructions:
-            return 0
-        return sum(1 for ji in self.job_instructions if ji.status == "failed")
+        return self.status_counts["failed"]
 
     @property
     def progress_percentage(self) -> float:
@@ -89,5 +85,5 @@ class Department:
             priority=data.get("priority", 1),
             enabled=data.get("enabled", True),
             job_instructions=job_instructions,
-            metadata=data.get("metadata", {})
+            metadata=data.get("metadata") or {}
         )
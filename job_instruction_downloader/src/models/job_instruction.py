@@ -2,13 +2,37 @@
 Data model for universal document processing.
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+_FILENAME_STRIP = re.compile(r'[^\w\s-]')
+_FILENAME_COLLAPSE = re.compile(r'[-\s]+')
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def clean_document_name(title: str) -> str:
+    """Build the file name stem used for a document title.
+
+    Every download path names files through this helper, so a document gets the
+    same name wherever it is saved. Each title is cleaned once per process.
+
+    Args:
+        title: Document title or file name.
+
+    Returns:
+        Title with punctuation removed and whitespace replaced by dashes,
+        at most 100 characters long.
+    """
+    clean_title = _FILENAME_STRIP.sub('', title)
+    clean_title = _FILENAME_COLLAPSE.sub('-', clean_title)
+    return clean_title.strip('-')[:100]
+
+
+@dataclass(slots=True)
 class JobInstruction:
     """Represents a document for universal processing (job instructions, contracts, policies, etc.)."""
 
@@ -20,7 +44,7 @@ class JobInstruction:
     download_date: Optional[datetime] = None
     status: str = "pending"  # pending, downloading, completed, failed
     error_message: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
     local_path: Optional[str] = None
     cloud_status: Optional[str] = None
     cloud_file_id: Optional[str] = None
@@ -31,16 +55,13 @@ class JobInstruction:
 
     def __post_init__(self):
         """Post-initialization processing."""
-        if self.metadata is None:
-            self.metadata = {}
-
         if self.download_date is None and self.status == "completed":
             self.download_date = datetime.now()
 
     @property
     def filename(self) -> str:
         """Generate filename for the document with appropriate extension."""
-        clean_title = self.clean_filename(self.title)
+        clean_title = clean_document_name(self.title)
         extension = self.file_extension or self._get_default_extension()
         return f"{clean_title}{extension}"
     
@@ -67,15 +88,7 @@ class JobInstruction:
 
     def clean_filename(self, filename: str) -> str:
         """Clean filename by removing invalid characters."""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-
-        filename = ' '.join(filename.split())
-        if len(filename) > 100:
-            filename = filename[:100]
-
-        return filename
+        return clean_document_name(filename)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -118,7 +131,7 @@ class JobInstruction:
             download_date=download_date,
             status=data.get("status", "pending"),
             error_message=data.get("error_message"),
-            metadata=data.get("metadata", {}),
+            metadata=data.get("metadata") or {},
             local_path=data.get("local_path"),
             cloud_status=data.get("cloud_status"),
             cloud_file_id=data.get("cloud_file_id"),
@@ -2,10 +2,53 @@
 Configuration management utilities.
 """
 
+import copy
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        path: Path of the JSON file.
+
+    Returns:
+        Parsed JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write a value as indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        path: Path of the JSON file.
+        data: Value to write.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 class ConfigManager:
@@ -22,11 +65,42 @@ class ConfigManager:
         else:
             self.config_dir = config_dir
 
+        self._sites_dir = self.config_dir / "sites"
+
         self.logger = logging.getLogger(__name__)
+        self._configs: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+    def _load_cached(self, config_path: Path) -> Tuple[Dict[str, Any], bool]:
+        """Parse a configuration file, reusing the previous result while the file is unchanged.
+
+        Callers get a deep copy, so changing the returned dictionary never leaks
+        into later loads.
+
+        Args:
+            config_path: Path of the configuration file.
+
+        Returns:
+            Tuple of (configuration dictionary, whether the file was parsed again).
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        mtime_ns = config_path.stat().st_mtime_ns
+        cached = self._configs.get(config_path)
+        if cached and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1]), False
+
+        config = _read_json(config_path)
+        config = config if isinstance(config, dict) else {}
+        self._configs[config_path] = (mtime_ns, config)
+        return copy.deepcopy(config), True
 
     def load_config(self, config_file: str = "settings.json") -> Dict[str, Any]:
         """Load main configuration file.
 
+        The parsed file is cached until its modification time changes.
+
         Args:
             config_file: Name of the configuration file.
 
@@ -36,10 +110,10 @@ class ConfigManager:
         config_path = self.config_dir / config_file
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            self.logger.info(f"Loaded configuration from {config_path}")
-            return config if isinstance(config, dict) else {}
+            config, parsed = self._load_cached(config_path)
+            if parsed:
+                self.logger.info(f"Loaded configuration from {config_path}")
+            return config
         except FileNotFoundError:
             self.logger.error(f"Configuration file not found: {config_path}")
             return {}
@@ -50,19 +124,21 @@ class ConfigManager:
     def load_site_config(self, site_name: str) -> Dict[str, Any]:
         """Load site-specific configuration.
 
+        The parsed file is cached until its modification time changes.
+
         Args:
             site_name: Name of the site configuration file (without .json).
 
         Returns:
             Site configuration dictionary.
         """
-        config_path = self.config_dir / "sites" / f"{site_name}.json"
+        config_path = self._sites_dir / f"{site_name}.json"
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            self.logger.info(f"Loaded site configuration from {config_path}")
-            return config if isinstance(config, dict) else {}
+            config, parsed = self._load_cached(config_path)
+            if parsed:
+                self.logger.info(f"Loaded site configuration from {config_path}")
+            return config
         except FileNotFoundError:
             self.logger.error(f"Site configuration file not found: {config_path}")
             return {}
@@ -93,8 +169,8 @@ class ConfigManager:
         try:
             config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _write_json(config_path, config)
+            self._configs.pop(config_path, None)
             self.logger.info(f"Saved configuration to {config_path}")
             return True
         except Exception as e:
@@ -3,7 +3,7 @@ Document type configuration manager for universal document processing.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, Optional
 from pathlib import Path
 
 from .config import ConfigManager
@@ -21,6 +21,7 @@ class DocumentTypeManager:
         self.config_manager = config_manager
         self.logger = logging.getLogger(__name__)
         self._document_types = None
+        self._extension_index: Optional[Dict[str, FrozenSet[str]]] = None
 
     @property
     def document_types(self) -> Dict[str, Any]:
@@ -151,5 +152,10 @@ class DocumentTypeManager:
         Returns:
             True if extension is supported, False otherwise.
         """
-        supported_extensions = self.get_supported_extensions(document_type)
-        return file_extension.lower() in [ext.lower() for ext in supported_extensions]
+        if self._extension_index is None:
+            self._extension_index = {
+                name: frozenset(ext.lower() for ext in config.get("supported_extensions", []))
+                for name, config in self.document_types.items()
+                if isinstance(config, dict)
+            }
+        return file_extension.lower() in self._extension_index.get(document_type, frozenset())
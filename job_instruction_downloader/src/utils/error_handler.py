@@ -5,7 +5,7 @@ Enhanced error handling with exponential backoff and retry logic.
 import logging
 import time
 import random
-from typing import Any, Callable, Optional, Dict, TypeVar, List
+from typing import Any, Callable, Optional, Dict, TypeVar, List, Type
 from functools import wraps
 
 
@@ -35,6 +35,9 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self.schedule = tuple(
+            min(base_delay * (exponential_base ** attempt), max_delay) for attempt in range(max_attempts)
+        )
 
 
 class EnhancedErrorHandler:
@@ -48,6 +51,7 @@ class EnhancedErrorHandler:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._random = random.Random()
 
         error_config = config.get("error_handling", {})
         self.retry_config = RetryConfig(
@@ -104,20 +108,26 @@ class EnhancedErrorHandler:
         Returns:
             Delay time in seconds.
         """
-        delay = self.retry_config.base_delay * (self.retry_config.exponential_base ** attempt)
-        delay = min(delay, self.retry_config.max_delay)
+        schedule = self.retry_config.schedule
+        if attempt < len(schedule):
+            delay = schedule[attempt]
+        else:
+            delay = min(self.retry_config.base_delay * (self.retry_config.exponential_base ** attempt),
+                        self.retry_config.max_delay)
 
         if self.retry_config.jitter:
-            delay *= (0.5 + random.random() * 0.5)
+            delay *= (0.5 + self._random.random() * 0.5)
 
         return delay
 
     def retry_on_exception(self,
-                           exceptions: Optional[List[type]] = None,
+                           exceptions: Optional[List[Type[BaseException]]] = None,
                            max_attempts: Optional[int] = None,
                            base_delay: Optional[float] = None):
         """Decorator for retrying functions on specific exceptions.
 
+        The retry settings are read once, when the decorator is created.
+
         Args:
             exceptions: List of exception types to retry on. If None, retries on all exceptions.
             max_attempts: Override default max attempts.
@@ -126,36 +136,40 @@ class EnhancedErrorHandler:
         Returns:
             Decorated function with retry logic.
         """
-        if exceptions is None:
-            exceptions = [Exception]
+        retry_on = tuple(exceptions) if exceptions is not None else (Exception,)
+        retry_config = RetryConfig(
+            max_attempts=max_attempts or self.retry_config.max_attempts,
+            base_delay=base_delay or self.retry_config.base_delay,
+            max_delay=self.retry_config.max_delay,
+            exponential_base=self.retry_config.exponential_base,
+            jitter=self.retry_config.jitter
+        )
+        max_retry = retry_config.max_attempts
+        schedule = retry_config.schedule
+        jitter = retry_config.jitter
+        rng = self._random
+        logger = self.logger
 
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> T:
-                max_retry = max_attempts or self.retry_config.max_attempts
-                delay = base_delay or self.retry_config.base_delay
-
                 last_exception = None
 
                 for attempt in range(max_retry):
                     try:
                         return func(*args, **kwargs)
-                    except Exception as e:
-                        if not any(isinstance(e, exc_type) for exc_type in exceptions):
-                            raise
+                    except retry_on as e:
                         last_exception = e
 
                         if attempt == max_retry - 1:
-                            self.logger.error(f"Function {func.__name__} failed after {max_retry} attempts: {e}")
+                            logger.error(f"Function {func.__name__} failed after {max_retry} attempts: {e}")
                             break
 
-                        retry_delay = delay * (self.retry_config.exponential_base ** attempt)
-                        retry_delay = min(retry_delay, self.retry_config.max_delay)
-
-                        if self.retry_config.jitter:
-                            retry_delay *= (0.5 + random.random() * 0.5)
+                        retry_delay = schedule[attempt]
+                        if jitter:
+                            retry_delay *= (0.5 + rng.random() * 0.5)
 
-                        self.logger.warning(
+                        logger.warning(
                             f"Function {func.__name__} failed (attempt {attempt + 1}/{max_retry}): {e}. "
                             f"Retrying in {retry_delay:.2f}s"
                         )
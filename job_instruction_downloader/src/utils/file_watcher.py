@@ -0,0 +1,76 @@
+"""
+Waiting for files to appear in a directory.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+PARTIAL_DOWNLOAD_SUFFIXES = (".crdownload", ".part", ".tmp")
+
+
+def wait_for_file_condition(directory: Path, condition: Callable[[], bool], timeout: float,
+                            poll_interval: float = 0.2) -> bool:
+    """Wait until a condition on the contents of a directory holds.
+
+    Uses file system notifications when watchdog is installed and polls
+    the directory otherwise.
+
+    Args:
+        directory: Directory to watch.
+        condition: Callable checked whenever the directory changes.
+        timeout: Maximum time to wait in seconds.
+        poll_interval: Seconds between checks when polling.
+
+    Returns:
+        True if the condition holds, False on timeout.
+    """
+    if WATCHDOG_AVAILABLE and directory.is_dir():
+        return _wait_for_event(directory, condition, timeout)
+
+    deadline = time.monotonic() + timeout
+    while True:
+        if condition():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_interval)
+
+
+def _wait_for_event(directory: Path, condition: Callable[[], bool], timeout: float) -> bool:
+    """Wait for a condition using file system notifications.
+
+    Args:
+        directory: Directory to watch.
+        condition: Callable checked whenever the directory changes.
+        timeout: Maximum time to wait in seconds.
+
+    Returns:
+        True if the condition holds, False on timeout.
+    """
+    satisfied = threading.Event()
+
+    class ConditionEventHandler(FileSystemEventHandler):
+        def on_any_event(self, event: Any) -> None:
+            if condition():
+                satisfied.set()
+
+    observer = Observer()
+    observer.schedule(ConditionEventHandler(), str(directory), recursive=False)
+    observer.start()
+
+    try:
+        if condition():
+            return True
+        return satisfied.wait(timeout)
+    finally:
+        observer.stop()
+        observer.join()
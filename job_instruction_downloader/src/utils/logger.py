@@ -2,11 +2,112 @@
 Logging configuration and utilities.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
+import re
 import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
+
+_QUEUE_LISTENER: Optional[logging.handlers.QueueListener] = None
+_INSTALLED_HANDLERS: List[logging.Handler] = []
+
+DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024
+_SIZE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*(KB|MB|GB)?\s*", re.IGNORECASE)
+_SIZE_MULTIPLIERS = {None: 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def parse_level(level: str, default: int = logging.INFO) -> int:
+    """Parse a level name such as "debug" or "WARNING" into a logging level.
+
+    Args:
+        level: Level name, in any case.
+        default: Value returned for unknown names.
+
+    Returns:
+        Numeric logging level.
+    """
+    return _LEVELS.get(str(level).upper(), default)
+
+
+def parse_size(size: Union[str, int], default: int = DEFAULT_MAX_FILE_SIZE) -> int:
+    """Parse a size such as "10MB", "500KB" or "1024" into bytes.
+
+    Args:
+        size: Size string, or a number of bytes.
+        default: Value returned if the size cannot be parsed.
+
+    Returns:
+        Size in bytes.
+    """
+    if isinstance(size, int):
+        return size
+
+    match = _SIZE.fullmatch(str(size))
+    if not match:
+        return default
+
+    value, unit = match.groups()
+    return int(float(value) * _SIZE_MULTIPLIERS[unit.upper() if unit else None])
+
+
+def install_handlers(handlers: List[logging.Handler], level: int, use_queue: bool = False) -> None:
+    """Replace the root logger's handlers.
+
+    With use_queue, logging calls only enqueue the record and a background
+    listener thread formats and writes it, keeping file I/O off the caller.
+
+    Args:
+        handlers: Handlers that write the records.
+        level: Root logger level.
+        use_queue: Whether to write records from a background thread.
+    """
+    global _QUEUE_LISTENER
+
+    stop_queue_listener()
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+
+    for handler in _INSTALLED_HANDLERS:
+        handler.close()
+    _INSTALLED_HANDLERS[:] = handlers
+
+    if not use_queue:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _QUEUE_LISTENER = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _QUEUE_LISTENER.start()
+
+
+def stop_queue_listener() -> None:
+    """Write out queued records and stop the background logging thread."""
+    global _QUEUE_LISTENER
+
+    listener = _QUEUE_LISTENER
+    _QUEUE_LISTENER = None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(stop_queue_listener)
 
 
 def setup_logging(
@@ -14,7 +115,8 @@ def setup_logging(
     log_file: Optional[Union[str, Path]] = None,
     console_output: bool = True,
     max_file_size: str = "10MB",
-    backup_count: int = 5
+    backup_count: int = 5,
+    use_queue: bool = False
 ) -> None:
     """Setup application logging.
 
@@ -24,24 +126,21 @@ def setup_logging(
         console_output: Whether to output logs to console.
         max_file_size: Maximum size of log file before rotation.
         backup_count: Number of backup log files to keep.
+        use_queue: Whether to write log records from a background thread.
     """
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    numeric_level = parse_level(log_level)
 
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(numeric_level)
-
-    root_logger.handlers.clear()
+    handlers: List[logging.Handler] = []
 
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(numeric_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     if log_file is None:
         log_dir = Path(__file__).parent.parent.parent / "logs"
@@ -51,30 +150,21 @@ def setup_logging(
         log_file_path = Path(log_file)
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    size_multipliers = {'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
-    max_bytes = 10 * 1024 * 1024  # Default 10MB
-
-    if isinstance(max_file_size, str):
-        for suffix, multiplier in size_multipliers.items():
-            if max_file_size.upper().endswith(suffix):
-                size_value = float(max_file_size[:-len(suffix)])
-                max_bytes = int(size_value * multiplier)
-                break
-
     file_handler = logging.handlers.RotatingFileHandler(
         log_file_path,
-        maxBytes=max_bytes,
+        maxBytes=parse_size(max_file_size),
         backupCount=backup_count,
         encoding='utf-8'
     )
-    file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
+
+    install_handlers(handlers, numeric_level, use_queue)
 
     logging.info("Logging system initialized")
-    logging.info(f"Log level: {log_level}")
-    logging.info(f"Log file: {log_file_path}")
-    logging.info(f"Console output: {console_output}")
+    logging.info("Log level: %s", log_level)
+    logging.info("Log file: %s", log_file_path)
+    logging.info("Console output: %s", console_output)
 
 
 def get_logger(name: str) -> logging.Logger:
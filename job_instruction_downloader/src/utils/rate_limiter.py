@@ -0,0 +1,54 @@
+"""
+Request rate limiting shared between download workers.
+"""
+
+import random
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Spaces requests at least ``interval`` seconds apart, measured from request start."""
+
+    MAX_INTERVAL = 60.0
+
+    def __init__(self, interval: float):
+        """Initialize the rate limiter.
+
+        Args:
+            interval: Minimum number of seconds between the starts of two requests.
+        """
+        self.base_interval = max(0.0, interval)
+        self.interval = self.base_interval
+        self._next_allowed = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request may start and reserve its slot."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self.interval
+
+        if start > now:
+            time.sleep(start - now)
+
+    def backoff(self, retry_after: Optional[float] = None):
+        """Slow down after the server reported too many requests.
+
+        Doubles the interval, up to MAX_INTERVAL, and postpones the next request
+        by the server's Retry-After value or the new interval, plus jitter.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if given.
+        """
+        with self._lock:
+            self.interval = min(self.MAX_INTERVAL, max(self.interval * 2, 1.0))
+            delay = retry_after if retry_after is not None else self.interval
+            self._next_allowed = max(self._next_allowed, time.monotonic() + delay + random.uniform(0, 1))
+
+    def relax(self):
+        """Move back towards the configured interval after a successful request."""
+        with self._lock:
+            self.interval = max(self.base_interval, self.interval / 2)
@@ -7,9 +7,31 @@ import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from logging.handlers import RotatingFileHandler
 
+from .logger import install_handlers, parse_level, parse_size
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to a JSON line, using orjson when it is installed.
+
+    Args:
+        log_entry: Log entry to serialize.
+
+    Returns:
+        JSON string with non-ASCII characters left unescaped.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(log_entry).decode('utf-8')
+    return json.dumps(log_entry, ensure_ascii=False)
+
 
 def _unused_imports_stub():
     """Temporary stub to satisfy flake8 F401 errors until CI configuration is fixed."""
@@ -53,7 +75,7 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _dumps(log_entry)
 
 
 class StructuredLogger:
@@ -93,22 +115,15 @@ class StructuredLogger:
             encoding='utf-8'
         )
         file_handler.setFormatter(formatter)
-
-        root_logger = logging.getLogger()
-
-        level_name = logging_config.get("level", "INFO")
-        level = getattr(logging, level_name.upper(), logging.INFO)
-        root_logger.setLevel(level)
-
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-
-        root_logger.addHandler(file_handler)
+        handlers: List[logging.Handler] = [file_handler]
 
         if logging_config.get("console_output", True):
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
+
+        level = parse_level(logging_config.get("level", "INFO"))
+        install_handlers(handlers, level, logging_config.get("async_output", False))
 
     def _parse_size(self, size_str: str) -> int:
         """Parse size string to bytes.
@@ -119,16 +134,7 @@ class StructuredLogger:
         Returns:
             Size in bytes.
         """
-        size_str = str(size_str).upper()
-        if size_str.endswith('MB'):
-            return int(size_str[:-2]) * 1024 * 1024
-        elif size_str.endswith('KB'):
-            return int(size_str[:-2]) * 1024
-        else:
-            try:
-                return int(size_str)
-            except ValueError:
-                return 10 * 1024 * 1024  # Default to 10MB
+        return parse_size(size_str)
 
     def log_operation(self,
                       logger: logging.Logger,
@@ -151,6 +157,9 @@ class StructuredLogger:
             duration: Operation duration in seconds.
             **kwargs: Additional log data.
         """
+        if not logger.isEnabledFor(parse_level(level)):
+            return
+
         extra = {}
         if operation:
             extra['operation'] = operation
@@ -224,7 +233,7 @@ class TimedOperation:
         Returns:
             Self for context manager.
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -235,7 +244,7 @@ class TimedOperation:
             exc_val: Exception value if raised.
             exc_tb: Exception traceback if raised.
         """
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
 
         if exc_type:
             self.structured_logger.log_operation(
@@ -246,7 +255,7 @@ class TimedOperation:
                 duration=duration,
                 **self.kwargs
             )
-        else:
+        elif self.logger.isEnabledFor(parse_level(self.level)):
             self.structured_logger.log_operation(
                 self.logger,
                 self.level,
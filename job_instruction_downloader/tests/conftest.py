@@ -11,6 +11,16 @@ from typing import Dict, Any
 from job_instruction_downloader.src.utils.config import ConfigManager
 
 
+@pytest.fixture(autouse=True)
+def clear_cloud_auth_cache():
+    """Keep memoized Google Drive credentials from leaking between tests."""
+    from job_instruction_downloader.src.core.cloud_manager import GoogleDriveManager
+
+    GoogleDriveManager.clear_auth_cache()
+    yield
+    GoogleDriveManager.clear_auth_cache()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -41,8 +51,7 @@ def sample_config() -> Dict[str, Any]:
             "driver_path": "auto",
             "headless": True,
             "window_size": [1920, 1080],
-            "page_load_timeout": 10,
-            "implicit_wait": 5
+            "page_load_timeout": 10
         },
         "logging": {
             "file_path": "test_logs/app.log",
@@ -0,0 +1,259 @@
+"""
+Tests for resource adapters.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from selenium.common.exceptions import WebDriverException
+
+from job_instruction_downloader.src.core.adapters.consultant_adapter import ConsultantAdapter, DriverPool
+from job_instruction_downloader.src.core.parsers.base_parser import NeedsJavaScript, WAIT_POLL_FREQUENCY
+from job_instruction_downloader.src.models.job_instruction import JobInstruction
+
+
+class TestDriverPool:
+    """Test WebDriver pool functionality."""
+
+    def test_drivers_reused(self):
+        """Test that released drivers are handed out again."""
+        factory = Mock(side_effect=lambda: Mock())
+        pool = DriverPool(2, factory)
+
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            pass
+
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_pool_bounded(self):
+        """Test that the pool never starts more drivers than its size."""
+        factory = Mock(side_effect=lambda: Mock())
+        pool = DriverPool(2, factory)
+
+        with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+
+        with pool.acquire(), pool.acquire():
+            pass
+
+        assert factory.call_count == 2
+
+    def test_unhealthy_driver_replaced(self):
+        """Test that a driver failing the health check is restarted."""
+        dead_driver = Mock()
+        live_driver = Mock()
+        factory = Mock(side_effect=[dead_driver, live_driver])
+        pool = DriverPool(1, factory, health_check=lambda driver: driver is not dead_driver)
+
+        with pool.acquire() as driver:
+            assert driver is live_driver
+
+        dead_driver.quit.assert_called_once()
+
+    def test_close_all(self):
+        """Test that closing the pool quits every driver."""
+        pool = DriverPool(2, Mock(side_effect=lambda: Mock()))
+
+        with pool.acquire() as first, pool.acquire() as second:
+            pass
+
+        pool.close_all()
+
+        first.quit.assert_called_once()
+        second.quit.assert_called_once()
+
+
+class TestConsultantAdapter:
+    """Test Consultant.ru adapter functionality."""
+
+    @patch('job_instruction_downloader.src.core.adapters.consultant_adapter.webdriver.Chrome')
+    def test_driver_reused_between_calls(self, mock_chrome, sample_department):
+        """Test that one browser session serves several calls."""
+        adapter = ConsultantAdapter({})
+        adapter.parser.extract_documents_static = Mock(side_effect=NeedsJavaScript("dynamic page"))
+        adapter.parser.extract_documents = Mock(return_value=[])
+
+        adapter.get_document_list(sample_department)
+        adapter.get_document_list(sample_department)
+
+        assert mock_chrome.call_count == 1
+        assert mock_chrome.return_value.delete_all_cookies.call_count == 2
+
+        adapter.close()
+        mock_chrome.return_value.quit.assert_called_once()
+
+    @patch('job_instruction_downloader.src.core.adapters.consultant_adapter.webdriver.Chrome')
+    def test_static_listing_skips_browser(self, mock_chrome, sample_department):
+        """Test that static listing pages are scraped without starting Chrome."""
+        adapter = ConsultantAdapter({})
+        documents = [JobInstruction(title="Doc", department=sample_department.name, url="https://example.com/1")]
+        adapter.parser.extract_documents_static = Mock(return_value=documents)
+
+        assert adapter.get_document_list(sample_department) == documents
+        mock_chrome.assert_not_called()
+
+    @patch('job_instruction_downloader.src.core.adapters.consultant_adapter.webdriver.Chrome')
+    def test_static_network_error_falls_back_to_browser(self, mock_chrome, sample_department):
+        """Test that a failed static request lists the documents in the browser."""
+        adapter = ConsultantAdapter({})
+        documents = [JobInstruction(title="Doc", department=sample_department.name, url="https://example.com/1")]
+        adapter.parser.extract_documents_static = Mock(side_effect=requests.Timeout("timed out"))
+        adapter.parser.extract_documents = Mock(return_value=documents)
+
+        assert adapter.get_document_list(sample_department) == documents
+        adapter.parser.extract_documents.assert_called_once_with(mock_chrome.return_value, sample_department)
+
+    @patch('job_instruction_downloader.src.core.adapters.consultant_adapter.webdriver.Chrome')
+    def test_driver_restarted_after_session_loss(self, mock_chrome):
+        """Test that a dead session is replaced with a new browser."""
+        dead_driver = Mock()
+        live_driver = Mock()
+        mock_chrome.side_effect = [dead_driver, live_driver]
+
+        adapter = ConsultantAdapter({})
+
+        with adapter.pool.acquire() as driver:
+            assert driver is dead_driver
+
+        type(dead_driver).current_url = property(Mock(side_effect=WebDriverException("gone")))
+
+        with adapter.pool.acquire() as driver:
+            assert driver is live_driver
+
+        dead_driver.quit.assert_called_once()
+
+    @patch('job_instruction_downloader.src.core.adapters.consultant_adapter.webdriver.Chrome')
+    def test_download_directory_set_via_cdp(self, mock_chrome, tmp_path):
+        """Test that download directory changes are applied without restarting."""
+        adapter = ConsultantAdapter({})
+
+        for download_dir in (tmp_path, tmp_path, tmp_path / "other"):
+            with adapter.pool.acquire() as driver:
+                adapter._prepare_driver(driver, download_dir)
+
+        assert mock_chrome.call_count == 1
+        cdp_calls = mock_chrome.return_value.execute_cdp_cmd.call_args_list
+        assert len(cdp_calls) == 2
+        assert cdp_calls[1][0][1]["downloadPath"] == str(tmp_path / "other")
+
+    def test_download_directory_tracked_per_session(self, tmp_path):
+        """Test that a new session is configured even if it reuses the old driver object."""
+        adapter = ConsultantAdapter({})
+        driver = Mock(session_id="first")
+
+        adapter._prepare_driver(driver, tmp_path)
+        driver.session_id = "second"
+        adapter._prepare_driver(driver, tmp_path)
+
+        assert driver.execute_cdp_cmd.call_count == 2
+
+    @patch('job_instruction_downloader.src.core.adapters.consultant_adapter.webdriver.Chrome')
+    def test_connection_pool_enlarged(self, mock_chrome):
+        """Test that the WebDriver command pool is sized from configuration."""
+        adapter = ConsultantAdapter({"selenium": {"connection_pool_maxsize": 8}})
+
+        with adapter.pool.acquire() as driver:
+            pass
+
+        assert mock_chrome.call_args[1]["keep_alive"] is True
+        pool_args = driver.command_executor._client_config.init_args_for_pool_manager
+        assert pool_args == {"init_args_for_pool_manager": {"maxsize": 8}}
+        driver.command_executor._get_connection_manager.assert_called_once()
+
+    def test_pool_size_from_site_config(self):
+        """Test that download parallelism sets the pool size."""
+        adapter = ConsultantAdapter({"site_config": {"download": {"parallelism": 3}}})
+
+        assert adapter.pool.size == 3
+
+    def test_site_config_sections(self):
+        """Test site configuration sections are exposed with dict fallbacks."""
+        adapter = ConsultantAdapter({
+            "site_config": {
+                "rate_limiting": "invalid",
+                "download": {"validation": {"min_size": 10}}
+            }
+        })
+
+        assert adapter.get_rate_limits() == {}
+        assert adapter.get_download_config() == {"validation": {"min_size": 10}}
+        assert adapter.get_validation_config() == {"min_size": 10}
+
+    def test_download_documents_preserves_order(self, tmp_path):
+        """Test parallel download results are returned in input order."""
+        adapter = ConsultantAdapter({})
+        adapter.download_document = Mock(side_effect=lambda document, path: document.title == "ok")
+        documents = [
+            JobInstruction(title="ok", department="TEST", url="https://example.com/1"),
+            JobInstruction(title="fail", department="TEST", url="https://example.com/2")
+        ]
+
+        results = adapter.download_documents(documents, tmp_path / "out")
+
+        assert results == [True, False]
+        assert (tmp_path / "out").is_dir()
+
+    def test_download_waits_only_for_export_button(self, tmp_path):
+        """Test that navigation is followed by a single fast-polling wait."""
+        adapter = ConsultantAdapter({})
+        adapter._wait_for_download = Mock(return_value=True)
+        driver = Mock()
+        document = JobInstruction(title="doc", department="TEST", url="https://example.com/1")
+
+        with patch('job_instruction_downloader.src.core.adapters.consultant_adapter.WebDriverWait') as mock_wait:
+            assert adapter._download_with(driver, document, tmp_path / "doc.docx") is True
+
+        mock_wait.assert_called_once_with(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY)
+        mock_wait.return_value.until.return_value.click.assert_called_once()
+
+    def test_wait_for_download(self, tmp_path):
+        """Test download completion detection."""
+        adapter = ConsultantAdapter({})
+        target = tmp_path / "document.docx"
+
+        assert adapter._wait_for_download(Mock(), target, 0.3) is False
+
+        target.write_bytes(b"PK" + b"\x00" * 10)
+        partial = tmp_path / "document.docx.crdownload"
+        partial.write_bytes(b"\x00")
+        assert adapter._wait_for_download(Mock(), target, 0.3) is False
+
+        partial.unlink()
+        assert adapter._wait_for_download(Mock(), target, 0.3) is True
+
+    def test_wait_for_download_ignores_other_downloads(self, tmp_path):
+        """Test that another worker's partial file does not block a finished download."""
+        adapter = ConsultantAdapter({})
+        target = tmp_path / "document.docx"
+        target.write_bytes(b"PK" + b"\x00" * 10)
+        (tmp_path / "other.docx.crdownload").write_bytes(b"\x00")
+
+        assert adapter._wait_for_download(Mock(), target, 0.3) is True
+
+    def test_wait_for_download_polling_fallback(self, tmp_path):
+        """Test download detection without file system notifications."""
+        adapter = ConsultantAdapter({})
+        target = tmp_path / "document.docx"
+        target.write_bytes(b"PK" + b"\x00" * 10)
+
+        with patch('job_instruction_downloader.src.utils.file_watcher.WATCHDOG_AVAILABLE', False):
+            assert adapter._wait_for_download(Mock(), target, 0.3) is True
+
+    def test_wait_for_download_event(self, tmp_path):
+        """Test that a file appearing during the wait is detected."""
+        pytest.importorskip("watchdog")
+        adapter = ConsultantAdapter({})
+        target = tmp_path / "document.docx"
+
+        timer = threading.Timer(0.1, target.write_bytes, args=(b"PK" + b"\x00" * 10,))
+        timer.start()
+        try:
+            assert adapter._wait_for_download(Mock(), target, 5) is True
+        finally:
+            timer.join()
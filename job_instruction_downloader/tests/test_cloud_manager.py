@@ -28,8 +28,8 @@ def cloud_manager(cloud_config):
 class TestGoogleDriveManager:
     """Test cases for GoogleDriveManager."""
 
-    @patch('job_instruction_downloader.src.core.cloud_manager.build')
-    @patch('job_instruction_downloader.src.core.cloud_manager.Credentials')
+    @patch('googleapiclient.discovery.build')
+    @patch('google.oauth2.credentials.Credentials')
     @patch('job_instruction_downloader.src.core.cloud_manager.Path')
     def test_authenticate_success(self, mock_path_class, mock_creds, mock_build, cloud_manager):
         """Test successful authentication."""
@@ -50,7 +50,7 @@ class TestGoogleDriveManager:
         
         mock_path_class.side_effect = path_side_effect
 
-        with patch('job_instruction_downloader.src.core.cloud_manager.InstalledAppFlow') as mock_flow:
+        with patch('google_auth_oauthlib.flow.InstalledAppFlow') as mock_flow:
             mock_flow_instance = Mock()
             mock_flow.from_client_secrets_file.return_value = mock_flow_instance
             mock_creds_instance = Mock()
@@ -63,6 +63,24 @@ class TestGoogleDriveManager:
         assert result is True
         assert cloud_manager.service == mock_service
 
+    @patch('googleapiclient.discovery.build')
+    @patch('google.oauth2.credentials.Credentials')
+    @patch('job_instruction_downloader.src.core.cloud_manager.Path')
+    def test_authenticate_reuses_cached_service(self, mock_path_class, mock_creds, mock_build, cloud_config):
+        """Test that a second manager reuses credentials and service."""
+        mock_path_class.return_value.exists.return_value = True
+        mock_creds.from_authorized_user_file.return_value.valid = True
+
+        first = GoogleDriveManager(cloud_config)
+        second = GoogleDriveManager(cloud_config)
+
+        assert first.authenticate() is True
+        assert second.authenticate() is True
+
+        assert mock_build.call_count == 1
+        assert mock_creds.from_authorized_user_file.call_count == 1
+        assert second.service is first.service
+
     def test_create_folder(self, cloud_manager):
         """Test folder creation."""
         mock_service = Mock()
@@ -85,6 +103,21 @@ class TestGoogleDriveManager:
 
         assert folder_id == 'folder123'
 
+    def test_find_folder_escapes_quotes(self, cloud_manager):
+        """Test that folder names with quotes produce a valid query."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {'files': []}
+        cloud_manager.service = mock_service
+
+        cloud_manager.find_folder("O'Brien \\ Co", "parent1")
+
+        query = mock_service.files().list.call_args[1]["q"]
+        assert query == (
+            "mimeType='application/vnd.google-apps.folder' and name='O\\'Brien \\\\ Co' "
+            "and 'parent1' in parents and trashed=false"
+        )
+        assert mock_service.files().list.call_args[1]["pageSize"] == 1
+
     def test_upload_file(self, cloud_manager, tmp_path):
         """Test file upload."""
         test_file = tmp_path / "test.docx"
@@ -94,11 +127,52 @@ class TestGoogleDriveManager:
         mock_service.files().create().execute.return_value = {'id': 'file123'}
         cloud_manager.service = mock_service
 
-        with patch('job_instruction_downloader.src.core.cloud_manager.MediaFileUpload'):
+        with patch('googleapiclient.http.MediaFileUpload'):
             file_id = cloud_manager.upload_file(str(test_file), "folder123", "custom_name.docx")
 
         assert file_id == 'file123'
 
+    def test_upload_large_file_in_chunks(self, cloud_manager, tmp_path):
+        """Test that large files use a chunked resumable upload."""
+        test_file = tmp_path / "large.pdf"
+        test_file.write_bytes(b"\x00" * 16)
+
+        mock_request = Mock()
+        mock_request.next_chunk.side_effect = [(Mock(progress=Mock(return_value=0.5)), None), (None, {'id': 'file456'})]
+        mock_service = Mock()
+        mock_service.files().create.return_value = mock_request
+        cloud_manager.service = mock_service
+        cloud_manager.RESUMABLE_THRESHOLD = 8
+
+        with patch('googleapiclient.http.MediaFileUpload') as mock_media:
+            file_id = cloud_manager.upload_file(str(test_file), "folder123")
+
+        assert file_id == 'file456'
+        assert mock_request.next_chunk.call_count == 2
+        assert mock_media.call_args[1]["resumable"] is True
+        assert mock_media.call_args[1]["mimetype"] == "application/pdf"
+
+    def test_upload_files_concurrently(self, cloud_manager, tmp_path):
+        """Test concurrent upload returns IDs in input order with per-thread transports."""
+        files = []
+        for name in ("a.docx", "b.docx", "missing.docx"):
+            path = tmp_path / name
+            if name != "missing.docx":
+                path.write_text("content")
+            files.append(str(path))
+
+        mock_service = Mock()
+        mock_service.files().create().execute.return_value = {'id': 'file123'}
+        cloud_manager.service = mock_service
+
+        with patch('googleapiclient.http.MediaFileUpload'), \
+                patch('google_auth_httplib2.AuthorizedHttp') as mock_auth_http:
+            file_ids = cloud_manager.upload_files(files, "folder123", max_workers=2)
+
+        assert file_ids == ['file123', 'file123', None]
+        assert 1 <= mock_auth_http.call_count <= 2
+        assert mock_service.files().create().execute.call_args[1]["http"] is not None
+
     def test_check_duplicate(self, cloud_manager):
         """Test duplicate checking."""
         mock_service = Mock()
@@ -111,6 +185,29 @@ class TestGoogleDriveManager:
 
         assert result is True
 
+    def test_check_duplicate_lists_folder_once(self, cloud_manager, tmp_path):
+        """Test that duplicate checks in one folder share a single listing."""
+        mock_service = Mock()
+        mock_service.files().list().execute.side_effect = [
+            {'files': [{'name': 'a.docx'}], 'nextPageToken': 'page2'},
+            {'files': [{'name': 'b.docx'}]},
+        ]
+        mock_service.files().create().execute.return_value = {'id': 'file123'}
+        mock_service.files().list.reset_mock()
+        cloud_manager.service = mock_service
+
+        assert cloud_manager.check_duplicate("a.docx", "folder123") is True
+        assert cloud_manager.check_duplicate("b.docx", "folder123") is True
+        assert cloud_manager.check_duplicate("c.docx", "folder123") is False
+
+        new_file = tmp_path / "c.docx"
+        new_file.write_bytes(b"PK")
+        with patch('googleapiclient.http.MediaFileUpload'):
+            cloud_manager.upload_file(str(new_file), "folder123")
+
+        assert cloud_manager.check_duplicate("c.docx", "folder123") is True
+        assert mock_service.files().list.call_count == 2
+
     def test_create_folder_structure(self, cloud_manager):
         """Test nested folder structure creation."""
         mock_service = Mock()
@@ -123,3 +220,94 @@ class TestGoogleDriveManager:
         folder_id = cloud_manager.create_folder_structure("parent/child")
 
         assert folder_id == 'folder2'
+
+    def test_create_folder_structure_reuses_existing(self, cloud_manager):
+        """Test that existing path components are resolved with one list call."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {
+            'files': [
+                {'id': 'parent1', 'name': 'parent', 'parents': ['root']},
+                {'id': 'child1', 'name': 'child', 'parents': ['parent1']}
+            ]
+        }
+        mock_service.files().create().execute.return_value = {'id': 'leaf1'}
+        mock_service.reset_mock()
+        cloud_manager.service = mock_service
+
+        folder_id = cloud_manager.create_folder_structure("parent/child/leaf")
+
+        assert folder_id == 'leaf1'
+        assert mock_service.files().list().execute.call_count == 1
+        assert mock_service.files().create().execute.call_count == 1
+
+    def test_get_or_create_folder_cached(self, cloud_manager):
+        """Test that resolved folder IDs are served from the cache."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {'files': [{'id': 'folder123'}]}
+        mock_service.reset_mock()
+        cloud_manager.service = mock_service
+
+        assert cloud_manager.get_or_create_folder("Dept", "root1") == 'folder123'
+        assert cloud_manager.get_or_create_folder("Dept", "root1") == 'folder123'
+        assert mock_service.files().list().execute.call_count == 1
+
+        assert cloud_manager.delete_folder('folder123') is True
+        assert cloud_manager.get_or_create_folder("Dept", "root1") == 'folder123'
+        assert mock_service.files().list().execute.call_count == 2
+
+    def test_folder_cache_bounded(self, cloud_manager):
+        """Test that the folder cache evicts least recently used entries."""
+        cloud_manager.FOLDER_CACHE_SIZE = 2
+
+        cloud_manager._cache_folder("a", None, "id_a")
+        cloud_manager._cache_folder("b", None, "id_b")
+        cloud_manager._get_cached_folder("a", None)
+        cloud_manager._cache_folder("c", None, "id_c")
+
+        assert cloud_manager._get_cached_folder("a", None) == "id_a"
+        assert cloud_manager._get_cached_folder("b", None) is None
+        assert cloud_manager._get_cached_folder("c", None) == "id_c"
+
+    def test_create_folder_structure_cached(self, cloud_manager):
+        """Test that a second structure creation makes no API calls."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {'files': []}
+        mock_service.files().create().execute.side_effect = [{'id': 'folder1'}, {'id': 'folder2'}]
+        mock_service.reset_mock()
+        cloud_manager.service = mock_service
+
+        assert cloud_manager.create_folder_structure("parent/child") == 'folder2'
+        assert cloud_manager.create_folder_structure("parent/child") == 'folder2'
+
+        assert mock_service.files().list().execute.call_count == 1
+        assert mock_service.files().create().execute.call_count == 2
+
+    def test_find_root_folder_uses_index(self, cloud_manager):
+        """Test that root-level lookups share a single listing request."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {
+            'files': [{'id': 'hr1', 'name': 'HR'}, {'id': 'it1', 'name': 'IT'}]
+        }
+        mock_service.files().list.reset_mock()
+        cloud_manager.service = mock_service
+
+        assert cloud_manager.find_folder("HR") == 'hr1'
+        assert cloud_manager.find_folder("IT") == 'it1'
+
+        assert mock_service.files().list.call_count == 1
+        query = mock_service.files().list.call_args[1]["q"]
+        assert query == "mimeType='application/vnd.google-apps.folder' and 'root' in parents and trashed=false"
+
+    def test_create_root_folder_invalidates_index(self, cloud_manager):
+        """Test that creating a root-level folder drops the root index."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {'files': [{'id': 'hr1', 'name': 'HR'}]}
+        mock_service.files().create().execute.return_value = {'id': 'new1'}
+        cloud_manager.service = mock_service
+
+        cloud_manager.find_folder("HR")
+        assert cloud_manager._root_folders == {'HR': 'hr1'}
+
+        cloud_manager.create_folder("Finance")
+
+        assert cloud_manager._root_folders is None
@@ -3,8 +3,13 @@ Tests for configuration management.
 """
 
 import json
+import os
+from unittest.mock import patch
 
-from job_instruction_downloader.src.utils.config import ConfigManager
+import pytest
+
+from job_instruction_downloader.src.utils import config as config_module
+from job_instruction_downloader.src.utils.config import ConfigManager, ORJSON_AVAILABLE
 
 
 def test_load_config_success(config_manager, sample_config):
@@ -56,6 +61,19 @@ def test_save_config(temp_dir):
     assert loaded_config == test_config
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_and_load_config_round_trip(temp_dir, use_orjson):
+    """Test that saved configuration keeps non-ASCII text readable with either JSON backend."""
+    config_manager = ConfigManager(temp_dir)
+    test_config = {"department": "ФИНАНСОВЫЙ ОТДЕЛ", "nested": {"values": [1, 2.5, None, True]}}
+
+    with patch('job_instruction_downloader.src.utils.config.ORJSON_AVAILABLE', use_orjson and ORJSON_AVAILABLE):
+        assert config_manager.save_config(test_config, "round_trip.json")
+        assert config_manager.load_config("round_trip.json") == test_config
+
+    assert "ФИНАНСОВЫЙ ОТДЕЛ" in (temp_dir / "round_trip.json").read_text(encoding="utf-8")
+
+
 def test_load_departments_config(config_manager):
     """Test loading departments configuration."""
     departments_config = {
@@ -76,3 +94,51 @@ def test_load_departments_config(config_manager):
     assert loaded_config == departments_config
     assert len(loaded_config["departments"]) == 1
     assert loaded_config["departments"][0]["name"] == "ТЕСТОВЫЙ ОТДЕЛ"
+
+
+def test_load_site_config_cached_until_modified(temp_dir):
+    """Test that site configuration is re-read only after the file changes."""
+    sites_dir = temp_dir / "sites"
+    sites_dir.mkdir()
+    site_file = sites_dir / "example.json"
+    site_file.write_text(json.dumps({"name": "first"}), encoding="utf-8")
+
+    config_manager = ConfigManager(temp_dir)
+    with patch('job_instruction_downloader.src.utils.config._read_json',
+               wraps=config_module._read_json) as mock_read:
+        first = config_manager.load_site_config("example")
+        assert config_manager.load_site_config("example") == first
+    assert mock_read.call_count == 1
+
+    site_file.write_text(json.dumps({"name": "second"}), encoding="utf-8")
+    stat = site_file.stat()
+    os.utime(site_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert config_manager.load_site_config("example") == {"name": "second"}
+
+
+def test_load_config_cached_until_saved(temp_dir):
+    """Test that the main configuration is parsed once and re-read after saving."""
+    config_manager = ConfigManager(temp_dir)
+    assert config_manager.save_config({"name": "first"}, "cached.json")
+
+    with patch('job_instruction_downloader.src.utils.config._read_json',
+               wraps=config_module._read_json) as mock_read:
+        first = config_manager.load_config("cached.json")
+        assert config_manager.load_config("cached.json") == first
+    assert mock_read.call_count == 1
+
+    assert config_manager.save_config({"name": "second"}, "cached.json")
+    assert config_manager.load_config("cached.json") == {"name": "second"}
+
+
+def test_loaded_config_changes_not_cached(temp_dir):
+    """Test that changing a loaded configuration does not affect later loads."""
+    config_manager = ConfigManager(temp_dir)
+    assert config_manager.save_config({"download": {"timeout": 30}}, "cached.json")
+
+    config = config_manager.load_config("cached.json")
+    config["download"]["timeout"] = 1
+    config["extra"] = True
+
+    assert config_manager.load_config("cached.json") == {"download": {"timeout": 30}}
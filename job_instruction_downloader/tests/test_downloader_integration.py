@@ -2,10 +2,17 @@
 Integration tests for DocumentDownloader with Phase 2 functionality.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from job_instruction_downloader.src.models.department import Department
+from job_instruction_downloader.src.models.job_instruction import JobInstruction
 
-from job_instruction_downloader.src.core.downloader import DocumentDownloader
+from job_instruction_downloader.src.core.downloader import DocumentDownloader, TabPipeline
+from job_instruction_downloader.src.utils.rate_limiter import RateLimiter
 
 
 @pytest.fixture
@@ -87,3 +94,471 @@ class TestDocumentDownloaderIntegration:
         )
 
         assert result is False
+
+    def test_static_documents_downloaded_concurrently(self, downloader_config, tmp_path):
+        """Test that direct document links are fetched without the browser."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        downloader_config["download"]["max_concurrent_downloads"] = 2
+        downloader = DocumentDownloader(downloader_config)
+
+        document_response = MagicMock(status_code=200, headers={"Content-Type": "application/msword"})
+        document_response.__enter__.return_value = document_response
+        document_response.iter_content.return_value = [b"PK", b"content"]
+        page_response = MagicMock(status_code=200, headers={"Content-Type": "text/html; charset=utf-8"})
+        page_response.__enter__.return_value = page_response
+
+        job_instructions = [
+            JobInstruction(title="Direct", department="IT", url="https://example.com/doc.docx"),
+            JobInstruction(title="Page", department="IT", url="https://example.com/page"),
+        ]
+        site_config = {"site_config": {"rate_limiting": {"delay_between_requests": 0}}}
+        responses = {job_instructions[0].url: document_response, job_instructions[1].url: page_response}
+        with patch.object(downloader._http, "get", side_effect=lambda url, **kwargs: responses[url]) as mock_get:
+            results = downloader._fetch_documents_static(job_instructions, site_config)
+
+        assert results[0] == (True, str(tmp_path / "Direct.docx"))
+        assert (tmp_path / "Direct.docx").read_bytes() == b"PKcontent"
+        assert results[1] is None
+        assert [call.args[0] for call in mock_get.call_args_list] == [job_instructions[0].url]
+        assert not list(tmp_path.glob("*.part"))
+        document_response.iter_content.assert_called_once_with(chunk_size=DocumentDownloader.DOWNLOAD_CHUNK_SIZE)
+
+    def test_html_page_not_probed_again(self, downloader_config, tmp_path):
+        """Test that a document URL serving HTML is remembered and left to the browser."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        downloader = DocumentDownloader(downloader_config)
+        downloader.rate_limiter = MagicMock()
+        job_instruction = JobInstruction(title="Doc", department="IT", url="https://example.com/doc.docx")
+
+        page_response = MagicMock(status_code=200, headers={"Content-Type": "text/html", "Content-Length": "512"})
+        page_response.__enter__.return_value = page_response
+        with patch.object(downloader._http, "get", return_value=page_response) as mock_get:
+            assert downloader._fetch_document_static(job_instruction) is None
+            assert downloader._fetch_document_static(job_instruction) is None
+
+        mock_get.assert_called_once()
+        downloader.rate_limiter.wait.assert_called_once()
+        page_response.iter_content.assert_not_called()
+        assert downloader._get_manifest_entry(job_instruction.url) == {"html_page": True}
+
+    @patch('job_instruction_downloader.src.core.downloader.webdriver.Chrome')
+    def test_driver_reused_across_runs(self, mock_chrome, downloader_config):
+        """Test that cleanup keeps the browser for the next downloader."""
+        with patch.dict('job_instruction_downloader.src.core.downloader._DRIVER_CACHE', clear=True):
+            first = DocumentDownloader(downloader_config)
+            assert first.setup_driver() is True
+            driver = first.driver
+            first.cleanup()
+
+            driver.delete_all_cookies.assert_called_once()
+            driver.quit.assert_not_called()
+
+            second = DocumentDownloader(downloader_config)
+            assert second.setup_driver() is True
+            assert second.driver is driver
+            assert mock_chrome.call_count == 1
+
+            second.shutdown()
+            driver.quit.assert_called_once()
+
+    @patch('job_instruction_downloader.src.core.downloader.webdriver.Chrome')
+    def test_pooled_driver_retargets_download_directory(self, mock_chrome, downloader_config, tmp_path):
+        """Test that a parked session is reused for a different download directory."""
+        with patch.dict('job_instruction_downloader.src.core.downloader._DRIVER_CACHE', clear=True):
+            downloader_config["download"]["temp_directory"] = str(tmp_path / "first")
+            first = DocumentDownloader(downloader_config)
+            first.setup_driver()
+            driver = first.driver
+            first.cleanup()
+
+            downloader_config["download"]["temp_directory"] = str(tmp_path / "second")
+            second = DocumentDownloader(downloader_config)
+            second.setup_driver()
+
+            assert second.driver is driver
+            assert mock_chrome.call_count == 1
+            driver.execute_cdp_cmd.assert_called_with(
+                "Page.setDownloadBehavior", {"behavior": "allow", "downloadPath": str(tmp_path / "second")}
+            )
+            second.shutdown()
+
+    @patch('job_instruction_downloader.src.core.downloader.time.monotonic')
+    @patch('job_instruction_downloader.src.core.downloader.webdriver.Chrome')
+    def test_idle_driver_expires(self, mock_chrome, mock_monotonic, downloader_config):
+        """Test that a session parked for longer than the idle timeout is replaced."""
+        downloader_config["selenium"] = {"driver_idle_timeout": 60}
+        mock_chrome.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_monotonic.return_value = 1000.0
+
+        with patch.dict('job_instruction_downloader.src.core.downloader._DRIVER_CACHE', clear=True):
+            first = DocumentDownloader(downloader_config)
+            first.setup_driver()
+            driver = first.driver
+            first.cleanup()
+
+            mock_monotonic.return_value = 1061.0
+            second = DocumentDownloader(downloader_config)
+            second.setup_driver()
+
+            assert second.driver is not driver
+            driver.quit.assert_called_once()
+            second.shutdown()
+
+    def test_wait_for_new_file(self, downloader_config, tmp_path):
+        """Test that only a finished file created after the click is picked up."""
+        downloader = DocumentDownloader(downloader_config)
+        (tmp_path / "old.docx").write_bytes(b"old")
+        existing_files = {"old.docx"}
+
+        placeholder = tmp_path / "new.docx"
+        placeholder.touch()
+        assert downloader._wait_for_new_file(tmp_path, existing_files, 0.3) is None
+        placeholder.unlink()
+
+        partial = tmp_path / "new.docx.crdownload"
+        partial.write_bytes(b"PK")
+        assert downloader._wait_for_new_file(tmp_path, existing_files, 0.3) is None
+
+        timer = threading.Timer(0.1, partial.rename, args=(tmp_path / "new.docx",))
+        timer.start()
+        try:
+            assert downloader._wait_for_new_file(tmp_path, existing_files, 5) == tmp_path / "new.docx"
+        finally:
+            timer.join()
+
+    def test_documents_spread_over_parallel_drivers(self, downloader_config, tmp_path):
+        """Test that one department's browser downloads use every worker's driver."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        downloader_config["selenium"] = {"parallel_drivers": 2}
+        downloader = DocumentDownloader(downloader_config)
+
+        department = Department(id="1", name="Dept", folder_name="dept")
+        documents = [
+            JobInstruction(title=f"Doc {i}", department="Dept", url=f"https://example.com/{i}") for i in range(4)
+        ]
+        static_document = JobInstruction(title="Static", department="Dept", url="https://example.com/static")
+        browser_calls = {}
+        callback_threads = set()
+        both_started = threading.Barrier(2, timeout=5)
+
+        def download(job_instruction, site_config, driver, download_dir, pipeline):
+            browser_calls[job_instruction.title] = (driver, download_dir)
+            if len(browser_calls) <= 2:
+                both_started.wait()
+            return True, str(download_dir / f"{job_instruction.title}.docx")
+
+        downloader.status_callback = lambda message: callback_threads.add(threading.current_thread())
+        prepared = [(document, None) for document in documents] + [(static_document, (True, "static.docx"))]
+
+        with patch.dict('job_instruction_downloader.src.core.downloader._DRIVER_CACHE', clear=True), \
+                patch.object(downloader, "_create_driver", side_effect=lambda *args, **kwargs: MagicMock()), \
+                patch.object(downloader, "_prepare_department", return_value=prepared), \
+                patch.object(downloader, "_download_single_document", side_effect=download):
+            assert downloader._process_departments_parallel([department], {}, False) is True
+
+        assert set(browser_calls) == {document.title for document in documents}
+        assert len({id(driver) for driver, _ in browser_calls.values()}) == 2
+        assert all(download_dir.parent == tmp_path for _, download_dir in browser_calls.values())
+        assert downloader.completed_documents == 5
+        assert callback_threads == {threading.current_thread()}
+
+    def test_worker_browsers_start_concurrently(self, downloader_config, tmp_path):
+        """Test that pooled workers start their browsers at the same time."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        downloader = DocumentDownloader(downloader_config)
+        both_starting = threading.Barrier(2, timeout=5)
+
+        def create_driver(*args, **kwargs):
+            both_starting.wait()
+            return MagicMock()
+
+        with patch.dict('job_instruction_downloader.src.core.downloader._DRIVER_CACHE', clear=True), \
+                patch.object(downloader, "_create_driver", side_effect=create_driver), \
+                downloader._chrome_pool() as get_driver, \
+                ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda _: get_driver(), range(2)))
+
+        assert {download_dir.name for _, download_dir in results} == {"worker-0", "worker-1"}
+
+    def test_parallel_worker_failures_reported(self, downloader_config, tmp_path):
+        """Test that crashed worker tasks are logged and counted as failed."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        downloader_config["selenium"] = {"parallel_drivers": 2}
+        downloader = DocumentDownloader(downloader_config)
+
+        department = Department(id="1", name="Dept", folder_name="dept")
+        broken = Department(id="2", name="Broken", folder_name="broken", job_instructions=[
+            JobInstruction(title="Lost", department="Broken", url="https://example.com/lost")
+        ])
+        document = JobInstruction(title="Doc", department="Dept", url="https://example.com/doc")
+
+        def prepare(dept, site_config, driver):
+            if dept is broken:
+                raise RuntimeError("extraction crashed")
+            return [(document, None)]
+
+        with patch.dict('job_instruction_downloader.src.core.downloader._DRIVER_CACHE', clear=True), \
+                patch.object(downloader, "_create_driver", side_effect=lambda *args, **kwargs: MagicMock()), \
+                patch.object(downloader, "_prepare_department", side_effect=prepare), \
+                patch.object(downloader, "_download_document", side_effect=RuntimeError("worker crashed")), \
+                patch.object(downloader.structured_logger, "log_operation") as mock_log:
+            assert downloader._process_departments_parallel([department, broken], {}, False) is False
+
+        assert downloader.failed_documents == 2
+        assert document.status == "failed"
+        assert broken.job_instructions[0].error_message == "extraction crashed"
+        messages = [call.args[2] for call in mock_log.call_args_list]
+        assert any("worker crashed" in message for message in messages)
+        assert any("extraction crashed" in message for message in messages)
+
+    def test_upload_runs_in_background(self, downloader_config):
+        """Test that a finished download is uploaded without blocking the next one."""
+        downloader = DocumentDownloader(downloader_config)
+        downloader.cloud_manager = MagicMock()
+        department = Department(id="1", name="IT", folder_name="it")
+        job_instruction = JobInstruction(title="Doc", department="IT", url="https://example.com/doc")
+        upload_started = threading.Event()
+        release_upload = threading.Event()
+
+        def upload(file_path, department_name, document_title):
+            upload_started.set()
+            return release_upload.wait(5)
+
+        with patch.object(downloader, "upload_to_cloud", side_effect=upload):
+            downloader._start_uploader()
+            downloader._download_document(department, job_instruction, (True, "doc.docx"), {}, True, None, None)
+
+            assert job_instruction.status == "completed"
+            assert upload_started.wait(5)
+            assert job_instruction.cloud_status != "uploaded"
+
+            release_upload.set()
+            downloader._stop_uploader()
+
+        assert job_instruction.cloud_status == "uploaded"
+        assert downloader._upload_queue is None
+
+    def test_invalid_browser_download_rejected(self, downloader_config, tmp_path):
+        """Test that a browser download failing validation is reported as failed."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        downloader = DocumentDownloader(downloader_config)
+        downloader.validator = MagicMock()
+        downloader.validator.validate_document_structure.return_value = {"valid": False}
+        job_instruction = JobInstruction(title="Doc", department="IT", url="https://example.com/page")
+
+        button = MagicMock()
+        button.get_attribute.return_value = None
+        (tmp_path / "error.html").write_bytes(b"<html>")
+
+        with patch('job_instruction_downloader.src.core.downloader.WebDriverWait') as mock_wait, \
+                patch.object(downloader, "_wait_for_new_file", return_value=tmp_path / "error.html"):
+            mock_wait.return_value.until.return_value = button
+            result = downloader._download_single_document(job_instruction, {}, MagicMock())
+
+        assert result == (False, None)
+        assert not (tmp_path / "Doc.docx").exists()
+
+    def test_download_url_resolved_from_button(self, downloader_config):
+        """Test that the button link is cached and fetched without clicking."""
+        downloader = DocumentDownloader(downloader_config)
+        job_instruction = JobInstruction(title="Doc", department="IT", url="https://example.com/page")
+
+        driver = MagicMock()
+        driver.get_cookies.return_value = [{"name": "session", "value": "abc"}]
+        button = MagicMock()
+        button.get_attribute.return_value = "https://example.com/export/doc.docx"
+
+        with patch('job_instruction_downloader.src.core.downloader.WebDriverWait') as mock_wait, \
+                patch.object(downloader, "_fetch_document_static", return_value=(True, "doc.docx")) as mock_fetch:
+            mock_wait.return_value.until.return_value = button
+            result = downloader._download_single_document(job_instruction, {}, driver)
+
+        assert result == (True, "doc.docx")
+        assert mock_wait.call_count == 1
+        assert job_instruction.metadata["download_url"] == "https://example.com/export/doc.docx"
+        mock_fetch.assert_called_once_with(job_instruction, "https://example.com/export/doc.docx", {"session": "abc"})
+        button.click.assert_not_called()
+
+    @patch('job_instruction_downloader.src.core.downloader.webdriver.Chrome')
+    def test_driver_blocks_static_resources(self, mock_chrome, downloader_config, tmp_path):
+        """Test that new drivers block images, styles and fonts via CDP."""
+        downloader = DocumentDownloader(downloader_config)
+
+        driver = downloader._create_driver(str(tmp_path))
+
+        commands = {call.args[0]: call.args[1] for call in driver.execute_cdp_cmd.call_args_list}
+        assert "*.css" in commands["Network.setBlockedURLs"]["urls"]
+        assert "*.woff2" in commands["Network.setBlockedURLs"]["urls"]
+        assert commands["Page.setDownloadBehavior"] == {"behavior": "allow", "downloadPath": str(tmp_path)}
+        driver.implicitly_wait.assert_not_called()
+        options = mock_chrome.call_args.kwargs["options"]
+        assert options.page_load_strategy == "eager"
+        assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+
+    def test_duplicate_url_reuses_download(self, downloader_config, tmp_path):
+        """Test that a URL shared between departments is downloaded once."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        downloader = DocumentDownloader(downloader_config)
+
+        first = tmp_path / "Policy.docx"
+        first.write_bytes(b"PKpolicy")
+        downloader._remember_download("https://example.com/policy", str(first))
+
+        same_title = JobInstruction(title="Policy", department="HR", url="https://example.com/policy")
+        other_title = JobInstruction(title="Company Policy", department="IT", url="https://example.com/policy")
+        unknown = JobInstruction(title="Other", department="IT", url="https://example.com/other")
+
+        assert downloader._reuse_cached_download(same_title) == (True, str(first))
+        assert downloader._reuse_cached_download(other_title) == (True, str(tmp_path / "Company-Policy.docx"))
+        assert (tmp_path / "Company-Policy.docx").read_bytes() == b"PKpolicy"
+        assert downloader._reuse_cached_download(unknown) is None
+
+    def test_unchanged_document_skipped(self, downloader_config, tmp_path):
+        """Test that a re-run sends cache validators and keeps the local file on 304."""
+        downloader_config["download"]["temp_directory"] = str(tmp_path)
+        job_instruction = JobInstruction(title="Doc", department="IT", url="https://example.com/page")
+
+        first_run = DocumentDownloader(downloader_config)
+        response = MagicMock(status_code=200, headers={"Content-Type": "application/msword", "ETag": '"v1"'})
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"PKdoc"]
+        with patch.object(first_run._http, "get", return_value=response):
+            first_run._fetch_document_static(job_instruction, "https://example.com/doc.docx")
+        first_run.cleanup()
+
+        second_run = DocumentDownloader(downloader_config)
+        not_modified = MagicMock(status_code=304, headers={})
+        not_modified.__enter__.return_value = not_modified
+        with patch.object(second_run._http, "get", return_value=not_modified) as mock_get:
+            result = second_run._fetch_document_static(job_instruction)
+
+        assert result == (True, str(tmp_path / "Doc.docx"))
+        assert mock_get.call_args[0][0] == "https://example.com/doc.docx"
+        assert mock_get.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+        assert (tmp_path / "Doc.docx").read_bytes() == b"PKdoc"
+
+    def test_progress_updates_coalesced(self, downloader_config):
+        """Test that rapid progress updates are batched and repeated statuses dropped."""
+        downloader = DocumentDownloader(downloader_config)
+        progress = []
+        statuses = []
+        downloader.progress_callback = lambda completed, total: progress.append(completed)
+        downloader.status_callback = statuses.append
+        downloader.total_documents = 3
+
+        for _ in range(3):
+            downloader.completed_documents += 1
+            downloader._update_progress()
+        downloader._flush_progress()
+
+        downloader._update_status("Working")
+        downloader._update_status("Working")
+        downloader._update_status("Done")
+
+        assert progress == [1, 3]
+        assert statuses == ["Working", "Done"]
+
+    def test_total_counts_enabled_and_extracted_documents(self, downloader_config):
+        """Test that disabled departments are excluded and extracted documents are counted."""
+        downloader = DocumentDownloader(downloader_config)
+
+        listed = Department(id="1", name="Listed", folder_name="listed", job_instructions=[
+            JobInstruction(title="A", department="Listed", url="https://example.com/a")
+        ])
+        disabled = Department(id="2", name="Disabled", folder_name="disabled", enabled=False, job_instructions=[
+            JobInstruction(title="B", department="Disabled", url="https://example.com/b")
+        ])
+        extracted = Department(id="3", name="Extracted", folder_name="extracted")
+        extracted_documents = [
+            JobInstruction(title="C", department="Extracted", url="https://example.com/c"),
+            JobInstruction(title="D", department="Extracted", url="https://example.com/d"),
+        ]
+        totals = []
+
+        def fetch(job_instructions, site_config):
+            totals.append(downloader.total_documents)
+            return [(False, None)] * len(job_instructions)
+
+        with patch.dict('job_instruction_downloader.src.core.downloader._DRIVER_CACHE', clear=True), \
+                patch.object(downloader.config_manager, "load_site_config", return_value={"site_config": {}}), \
+                patch.object(downloader, "setup_driver", return_value=True), \
+                patch.object(downloader, "extract_department_documents", return_value=extracted_documents), \
+                patch.object(downloader, "_fetch_documents_static", side_effect=fetch):
+            downloader.driver = MagicMock()
+            downloader.parser = MagicMock()
+            assert downloader.download_documents([listed, disabled, extracted], upload_to_cloud=False) is True
+
+        assert totals == [1, 3]
+        assert downloader.failed_documents == 3
+
+
+class TestTabPipeline:
+    """Test background tab prefetching."""
+
+    def _driver(self):
+        """Build a mock driver that opens a new handle per window.open call and tracks the selected tab."""
+        driver = MagicMock()
+        driver.current_window_handle = "main"
+        driver.window_handles = ["main"]
+        driver.selected = "main"
+        driver.loaded = {}
+
+        def execute_script(script, *args):
+            if script.startswith("window.open"):
+                driver.window_handles = driver.window_handles + [f"tab-{len(driver.window_handles)}"]
+            else:
+                driver.loaded[driver.selected] = args[0]
+
+        def switch_to_window(handle):
+            driver.selected = handle
+
+        driver.execute_script.side_effect = execute_script
+        driver.switch_to.window.side_effect = switch_to_window
+        return driver
+
+    def test_prefetch_and_activate(self):
+        """Test that prefetched pages are switched to instead of reloaded."""
+        driver = self._driver()
+        pipeline = TabPipeline(driver, 1, RateLimiter(0))
+
+        pipeline.prefetch(["a", "b"])
+        assert driver.loaded == {"tab-1": "a"}
+        assert driver.selected == "main"
+
+        assert pipeline.activate("a") is True
+        driver.close.assert_called_once()
+        driver.switch_to.window.assert_called_with("tab-1")
+
+        assert pipeline.activate("b") is False
+
+    def test_new_tabs_get_network_settings(self, downloader_config, tmp_path):
+        """Test that request blocking and the download directory are applied to each new tab."""
+        downloader = DocumentDownloader(downloader_config)
+        driver = self._driver()
+        cdp_calls = []
+        driver.execute_cdp_cmd.side_effect = lambda command, params: cdp_calls.append(
+            (driver.selected, command, dict(driver.loaded))
+        )
+
+        pipeline = downloader._create_tab_pipeline(driver, tmp_path)
+        pipeline.prefetch(["a"])
+
+        assert [(tab, command) for tab, command, _ in cdp_calls] == [
+            ("tab-1", "Network.enable"),
+            ("tab-1", "Network.setBlockedURLs"),
+            ("tab-1", "Page.setDownloadBehavior"),
+        ]
+        assert all(loaded == {} for _, _, loaded in cdp_calls)
+        assert driver.loaded == {"tab-1": "a"}
+        assert driver.execute_cdp_cmd.call_args[0][1]["downloadPath"] == str(tmp_path.absolute())
+
+    def test_close_discards_unused_tabs(self):
+        """Test that unused prefetched tabs are closed and focus returns to the active tab."""
+        driver = self._driver()
+        pipeline = TabPipeline(driver, 2, RateLimiter(0))
+
+        pipeline.prefetch(["a", "b"])
+        pipeline.close()
+
+        assert driver.close.call_count == 2
+        driver.switch_to.window.assert_called_with("main")
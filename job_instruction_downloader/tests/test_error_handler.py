@@ -37,6 +37,7 @@ class TestEnhancedErrorHandler:
         assert config.base_delay == 2.0
         assert config.exponential_base == 2.0
         assert config.jitter is True
+        assert config.schedule == (2.0, 4.0, 8.0, 16.0, 32.0)
 
     def test_successful_operation(self, error_handler):
         """Test successful operation without retries."""
@@ -92,3 +93,13 @@ class TestEnhancedErrorHandler:
 
         assert result == "success"
         assert call_count == 2
+
+    def test_retry_decorator_ignores_other_exceptions(self, error_handler):
+        """Test retry decorator re-raises exceptions it was not asked to retry."""
+        mock_function = Mock(side_effect=KeyError("other error"))
+        decorated = error_handler.retry_on_exception([ValueError], max_attempts=3)(mock_function)
+
+        with pytest.raises(KeyError):
+            decorated()
+
+        assert mock_function.call_count == 1
@@ -69,8 +69,8 @@ class TestPhase2Integration:
         assert downloader.structured_logger is not None
         assert downloader.cloud_manager is None  # Not initialized until setup
 
-    @patch('job_instruction_downloader.src.core.cloud_manager.build')
-    @patch('job_instruction_downloader.src.core.cloud_manager.Credentials')
+    @patch('googleapiclient.discovery.build')
+    @patch('google.oauth2.credentials.Credentials')
     @patch('job_instruction_downloader.src.core.cloud_manager.Path')
     def test_cloud_storage_setup(self, mock_path_class, mock_creds, mock_build, integration_config):
         """Test cloud storage setup."""
@@ -93,7 +93,7 @@ class TestPhase2Integration:
         
         mock_path_class.side_effect = path_side_effect
 
-        with patch('job_instruction_downloader.src.core.cloud_manager.InstalledAppFlow') as mock_flow:
+        with patch('google_auth_oauthlib.flow.InstalledAppFlow') as mock_flow:
             mock_flow_instance = Mock()
             mock_flow.from_client_secrets_file.return_value = mock_flow_instance
             mock_creds_instance = Mock()
@@ -32,7 +32,7 @@ def test_job_instruction_filename():
     )
 
     filename = ji.filename
-    assert filename == "Тестовая инструкция с _специальными_ символами.docx"
+    assert filename == "Тестовая-инструкция-с-специальными-символами.docx"
 
 
 def test_job_instruction_clean_filename():
@@ -133,6 +133,8 @@ def test_department_progress_calculation():
     assert dept.completed_documents == 2
     assert dept.failed_documents == 1
     assert dept.progress_percentage == 50.0
+    assert dept.status_counts["completed"] == 2
+    assert dept.status_counts["downloading"] == 0
 
 
 def test_department_serialization():
@@ -157,3 +159,18 @@ def test_department_serialization():
     assert dept_restored.priority == dept.priority
     assert len(dept_restored.job_instructions) == 1
     assert dept_restored.job_instructions[0].title == "Test"
+
+
+def test_models_use_slots():
+    """Test that model instances have no instance dict and do not share defaults."""
+    first = Department(id="a", name="A", folder_name="a")
+    second = Department(id="b", name="B", folder_name="b")
+    ji = JobInstruction(title="Инструкция", department="A", url="https://example.com/a")
+
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(ji, "__dict__")
+
+    first.add_job_instruction(ji)
+    first.metadata["key"] = "value"
+    assert second.job_instructions == []
+    assert second.metadata == {}
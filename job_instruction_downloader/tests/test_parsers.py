@@ -2,9 +2,12 @@
 Tests for parser functionality.
 """
 
-from unittest.mock import Mock
+import pytest
+from unittest.mock import Mock, patch
 
-from job_instruction_downloader.src.core.parsers.base_parser import BaseParser
+from selenium.common.exceptions import TimeoutException
+
+from job_instruction_downloader.src.core.parsers.base_parser import BaseParser, NeedsJavaScript
 from job_instruction_downloader.src.core.parsers.consultant_parser import ConsultantParser
 from job_instruction_downloader.src.models.department import Department
 
@@ -64,6 +67,28 @@ class TestBaseParser:
         assert selectors["document_links"] == "[devinid]"
         assert selectors["export_button"] == "[devinid='14']"
 
+    def test_config_accessors(self):
+        """Test rate limit, download and validation config retrieval."""
+        config = {
+            "site_config": {
+                "rate_limiting": "invalid",
+                "download": {"validation": {"min_size": 10}}
+            }
+        }
+
+        class TestParser(BaseParser):
+            def extract_documents(self, driver, department):
+                return []
+
+            def validate_document(self, file_path):
+                return True
+
+        parser = TestParser(config)
+
+        assert parser.get_rate_limits() == {}
+        assert parser.get_download_config() == {"validation": {"min_size": 10}}
+        assert parser.get_validation_config() == {"min_size": 10}
+
     def test_process_title(self):
         """Test title processing."""
         config = {
@@ -95,6 +120,8 @@ class TestBaseParser:
         processed_long = parser.process_title(long_title)
         assert len(processed_long) <= 50
 
+        assert parser.process_title("Инструкция  по   охране труда") == "Инструкция по охране труда"
+
 
 class TestConsultantParser:
     """Test Consultant.ru parser functionality."""
@@ -185,3 +212,144 @@ class TestConsultantParser:
 
         documents = parser.extract_documents(None, department)
         assert documents == []
+
+    def test_extract_documents_without_matches(self, sample_department):
+        """Test that a page without document links yields no documents."""
+        config = {
+            "site_config": {
+                "site_info": {"base_url": "https://cloud.consultant.ru"},
+                "navigation": {"start_url": "/list"}
+            }
+        }
+        parser = ConsultantParser(config)
+
+        with patch('job_instruction_downloader.src.core.parsers.consultant_parser.WebDriverWait') as mock_wait:
+            mock_wait.return_value.until.side_effect = TimeoutException()
+            documents = parser.extract_documents(Mock(), sample_department)
+
+        assert documents == []
+        assert mock_wait.call_args[1]["poll_frequency"] == 0.05
+
+    def test_extract_documents_reads_links_in_one_script(self, sample_department):
+        """Test that document titles and URLs are read with a single script execution."""
+        config = {
+            "site_config": {
+                "site_info": {"base_url": "https://cloud.consultant.ru"},
+                "navigation": {"start_url": "/list"}
+            }
+        }
+        parser = ConsultantParser(config)
+        elements = [Mock(), Mock()]
+        driver = Mock()
+        driver.execute_script.return_value = [
+            ["Инструкция 1", "https://cloud.consultant.ru/doc/1", None],
+            ["Инструкция 2", None, "location.href='/doc/2'"]
+        ]
+
+        with patch('job_instruction_downloader.src.core.parsers.consultant_parser.WebDriverWait') as mock_wait:
+            mock_wait.return_value.until.return_value = elements
+            documents = parser.extract_documents(driver, sample_department)
+
+        assert [doc.url for doc in documents] == [
+            "https://cloud.consultant.ru/doc/1", "https://cloud.consultant.ru/doc/2"
+        ]
+        assert [doc.title for doc in documents] == ["Инструкция 1", "Инструкция 2"]
+        driver.get.assert_called_once_with("https://cloud.consultant.ru/list")
+        driver.execute_script.assert_called_once()
+        for element in elements:
+            element.get_attribute.assert_not_called()
+            element.find_element.assert_not_called()
+
+    def test_extract_documents_falls_back_to_element_lookups(self, sample_department):
+        """Test per-element extraction when the link script is unavailable."""
+        config = {
+            "site_config": {
+                "site_info": {"base_url": "https://cloud.consultant.ru"},
+                "navigation": {"start_url": "/list"}
+            }
+        }
+        parser = ConsultantParser(config)
+        with_title = Mock()
+        with_title.find_elements.return_value = [Mock(text=" Инструкция 1 ")]
+        with_title.get_attribute.return_value = "/doc/1"
+        without_title = Mock()
+        without_title.find_elements.return_value = []
+        without_title.get_attribute.return_value = "/doc/2"
+        driver = Mock()
+        driver.execute_script.side_effect = Exception("scripts disabled")
+        driver.find_elements.return_value = [Mock(text="Общий заголовок")]
+
+        with patch('job_instruction_downloader.src.core.parsers.consultant_parser.WebDriverWait') as mock_wait:
+            mock_wait.return_value.until.return_value = [with_title, without_title]
+            documents = parser.extract_documents(driver, sample_department)
+
+        assert [doc.title for doc in documents] == ["Инструкция 1", "Общий заголовок"]
+        assert [doc.url for doc in documents] == [
+            "https://cloud.consultant.ru/doc/1", "https://cloud.consultant.ru/doc/2"
+        ]
+        driver.find_elements.assert_called_once()
+
+    def test_extract_documents_reuses_loaded_page(self, sample_department):
+        """Test that the listing page is not reloaded when the driver already shows it."""
+        config = {
+            "site_config": {
+                "site_info": {"base_url": "https://cloud.consultant.ru"},
+                "navigation": {"start_url": "/list"}
+            }
+        }
+        parser = ConsultantParser(config)
+        driver = Mock(current_url="https://cloud.consultant.ru/list")
+
+        with patch('job_instruction_downloader.src.core.parsers.consultant_parser.WebDriverWait') as mock_wait:
+            mock_wait.return_value.until.side_effect = TimeoutException()
+            parser.extract_documents(driver, sample_department)
+
+        driver.get.assert_not_called()
+
+    def _static_session(self, html, status_code=200, content_type="text/html; charset=utf-8"):
+        """Build a mock HTTP session returning the given page."""
+        response = Mock(status_code=status_code, text=html, headers={"Content-Type": content_type})
+        session = Mock()
+        session.get.return_value = response
+        return session
+
+    def test_extract_documents_static(self, sample_department):
+        """Test document extraction from static HTML."""
+        config = {
+            "site_config": {
+                "site_info": {"base_url": "https://cloud.consultant.ru"},
+                "navigation": {"start_url": "/list"},
+                "extraction": {"selectors": {"document_links": "a[devinid]", "document_title": ".title"}}
+            }
+        }
+        parser = ConsultantParser(config)
+        html = (
+            '<html><body>'
+            '<a devinid="1" href="/doc/1"><span class="title">Первый</span></a>'
+            '<a devinid="2" onclick="location.href=\'/doc/2\'"><span class="title">Второй</span></a>'
+            '</body></html>'
+        )
+
+        documents = parser.extract_documents_static(self._static_session(html), sample_department)
+
+        assert [d.title for d in documents] == ["Первый", "Второй"]
+        assert [d.url for d in documents] == [
+            "https://cloud.consultant.ru/doc/1",
+            "https://cloud.consultant.ru/doc/2"
+        ]
+
+    def test_extract_documents_static_needs_javascript(self, sample_department):
+        """Test that pages without static document links require a browser."""
+        config = {
+            "site_config": {
+                "site_info": {"base_url": "https://cloud.consultant.ru"},
+                "navigation": {"start_url": "/list"}
+            }
+        }
+        parser = ConsultantParser(config)
+
+        with pytest.raises(NeedsJavaScript):
+            parser.extract_documents_static(self._static_session("<html><body></body></html>"), sample_department)
+
+        with pytest.raises(NeedsJavaScript):
+            parser.extract_documents_static(self._static_session("", status_code=403), sample_department)
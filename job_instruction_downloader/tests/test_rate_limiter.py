@@ -0,0 +1,53 @@
+"""
+Tests for request rate limiting.
+"""
+
+from unittest.mock import patch
+
+from job_instruction_downloader.src.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test rate limiter scheduling."""
+
+    def test_wait_counts_from_previous_start(self):
+        """Test that time spent on a request counts towards the interval."""
+        with patch('job_instruction_downloader.src.utils.rate_limiter.time') as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            limiter = RateLimiter(3)
+
+            limiter.wait()
+            mock_time.sleep.assert_not_called()
+
+            mock_time.monotonic.return_value = 102.0
+            limiter.wait()
+            mock_time.sleep.assert_called_once_with(1.0)
+
+            mock_time.monotonic.return_value = 110.0
+            limiter.wait()
+            assert mock_time.sleep.call_count == 1
+
+    def test_backoff_and_relax(self):
+        """Test that the interval grows on rate limiting and recovers afterwards."""
+        limiter = RateLimiter(2)
+
+        limiter.backoff()
+        limiter.backoff()
+        assert limiter.interval == 8
+
+        limiter.relax()
+        limiter.relax()
+        limiter.relax()
+        assert limiter.interval == 2
+
+    def test_backoff_honours_retry_after(self):
+        """Test that the next request is postponed by the server's Retry-After."""
+        with patch('job_instruction_downloader.src.utils.rate_limiter.time') as mock_time, \
+                patch('job_instruction_downloader.src.utils.rate_limiter.random.uniform', return_value=0):
+            mock_time.monotonic.return_value = 100.0
+            limiter = RateLimiter(0)
+
+            limiter.backoff(retry_after=30)
+            limiter.wait()
+
+            mock_time.sleep.assert_called_once_with(30.0)
@@ -5,10 +5,12 @@ Tests for structured logging system.
 import pytest
 import json
 import logging
+import logging.handlers
 from unittest.mock import patch
 
+from job_instruction_downloader.src.utils.logger import parse_level, stop_queue_listener
 from job_instruction_downloader.src.utils.structured_logger import (
-    StructuredLogger, StructuredFormatter, TimedOperation
+    ORJSON_AVAILABLE, StructuredLogger, StructuredFormatter, TimedOperation
 )
 
 
@@ -63,6 +65,27 @@ class TestStructuredFormatter:
         assert log_data["line"] == 10
         assert "timestamp" in log_data
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_format_keeps_non_ascii_text(self, use_orjson):
+        """Test that both JSON backends write non-ASCII text unescaped."""
+        formatter = StructuredFormatter()
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Загружено: %s",
+            args=("ФИНАНСОВЫЙ ОТДЕЛ",),
+            exc_info=None
+        )
+
+        with patch('job_instruction_downloader.src.utils.structured_logger.ORJSON_AVAILABLE',
+                   use_orjson and ORJSON_AVAILABLE):
+            result = formatter.format(record)
+
+        assert "Загружено: ФИНАНСОВЫЙ ОТДЕЛ" in result
+        assert json.loads(result)["message"] == "Загружено: ФИНАНСОВЫЙ ОТДЕЛ"
+
     def test_format_with_extra_fields(self):
         """Test formatting with extra structured fields."""
         formatter = StructuredFormatter()
@@ -104,6 +127,16 @@ class TestStructuredLogger:
         assert structured_logger._parse_size("500KB") == 500 * 1024
         assert structured_logger._parse_size("1024") == 1024
         assert structured_logger._parse_size("invalid") == 10 * 1024 * 1024
+        assert structured_logger._parse_size("1.5 gb") == int(1.5 * 1024**3)
+        assert structured_logger._parse_size("abcMB") == 10 * 1024 * 1024
+
+    def test_parse_level(self):
+        """Test level name parsing."""
+        assert parse_level("debug") == logging.DEBUG
+        assert parse_level("WARN") == logging.WARNING
+        assert parse_level("warning") == logging.WARNING
+        assert parse_level("BASIC_FORMAT") == logging.INFO
+        assert parse_level("unknown", logging.ERROR) == logging.ERROR
 
     def test_log_operation(self, structured_logger):
         """Test structured operation logging."""
@@ -121,6 +154,35 @@ class TestStructuredLogger:
             assert kwargs["extra"]["operation"] == "test_op"
             assert kwargs["extra"]["department"] == "test_dept"
 
+    def test_log_operation_skips_disabled_level(self, structured_logger):
+        """Test that records below the logger's level are not built."""
+        logger = logging.getLogger("test.disabled")
+        logger.setLevel(logging.WARNING)
+
+        with patch.object(logger, 'info') as mock_info, \
+                patch.object(logger, 'warning') as mock_warning:
+            structured_logger.log_operation(logger, "info", "Hidden", operation="test_op")
+            structured_logger.log_operation(logger, "warning", "Shown", operation="test_op")
+
+        mock_info.assert_not_called()
+        mock_warning.assert_called_once()
+
+    def test_async_output_writes_from_listener(self, logging_config, tmp_path):
+        """Test queued records reach the log file once the listener is stopped."""
+        log_file = tmp_path / "async.log"
+        logging_config["logging"]["file_path"] = str(log_file)
+        logging_config["logging"]["async_output"] = True
+
+        StructuredLogger(logging_config)
+        root_logger = logging.getLogger()
+        assert isinstance(root_logger.handlers[0], logging.handlers.QueueHandler)
+
+        logging.getLogger("test").info("Queued message")
+        stop_queue_listener()
+
+        record = json.loads(log_file.read_text(encoding="utf-8").splitlines()[-1])
+        assert record["message"] == "Queued message"
+
     def test_timed_operation_context_manager(self, structured_logger):
         """Test timed operation context manager."""
         logger = logging.getLogger("test")